@@ -5,6 +5,7 @@ from collections.abc import AsyncIterator
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 
 from .server.api.analysis import column_stats, count_rows, llm_models, nl_query, run_eda, run_query, search, translation_languages
 from .server.api.analysis import router as analysis_router
@@ -41,11 +42,12 @@ from .server.api.jobs import (
 from .server.api.jobs import (
     router as jobs_router,
 )
-from .server.api.mutations import delete_column, delete_row
+from .server.api.mutations import compact_deleted_rows, delete_column, delete_row
 from .server.api.mutations import router as mutations_router
 from .server.api.schemas import (
     AtlasQueryRequest,
     AtlasRequest,
+    CompactDeletedRowsRequest,
     CountJobRequest,
     DeleteColumnRequest,
     DeleteRowRequest,
@@ -87,7 +89,9 @@ def create_app(*, job_store: JobStore | None = None, atlas_runtime: AtlasRuntime
             await owned_atlas_runtime.close_proxy_client()
             owned_job_store.shutdown(wait_timeout=0.0)
 
-    application = FastAPI(title="Data Viewer", lifespan=lifespan)
+    # orjson encodes large preview payloads in one C pass, replacing the
+    # pure-Python json.dumps walk that dominated big-table response times.
+    application = FastAPI(title="Data Viewer", lifespan=lifespan, default_response_class=ORJSONResponse)
     application.state.job_store = owned_job_store
     application.state.atlas_runtime = owned_atlas_runtime
     application.include_router(datasets_router)
@@ -105,6 +109,7 @@ app = create_app()
 __all__ = [
     "AtlasQueryRequest",
     "AtlasRequest",
+    "CompactDeletedRowsRequest",
     "CountJobRequest",
     "DeleteColumnRequest",
     "DeleteRowRequest",
@@ -122,6 +127,7 @@ __all__ = [
     "cancel_job",
     "column_sample",
     "column_stats",
+    "compact_deleted_rows",
     "count_rows",
     "create_app",
     "delete_column",
@@ -7,14 +7,14 @@ from fastapi import APIRouter, HTTPException, Query
 from ..config import DEFAULT_LIMIT, DEFAULT_SAMPLE
 from ..db import (
     build_table_response,
+    columnarize_table_response,
     count_relation_rows,
-    describe_relation,
     fetch_rows_with_rowid,
     normalize_pagination,
     open_connection,
-    quote_ident,
-    relation_sql,
     relation_with_rowid_sql,
+    schema_for,
+    search_match_clause,
 )
 from ..deleted_rows import deleted_row_ids_for
 from ..files import resolve_data_file
@@ -68,9 +68,7 @@ def nl_query(payload: NLQueryRequest) -> dict[str, Any]:
     prompt = payload.prompt.strip()
     if not prompt:
         raise HTTPException(status_code=400, detail="prompt must not be empty")
-    relation, params = relation_sql(path)
-    with open_connection() as connection:
-        columns = describe_relation(connection, relation, params)
+    columns = schema_for(path)
     result = generate_sql_request(prompt, columns, payload.sample, payload.model)
     return {"sql": result.sql, "model": result.model_id, "model_label": result.model_label}
 
@@ -89,9 +87,15 @@ def search(
     query: str = Query(...),
     limit: int | None = Query(DEFAULT_LIMIT),
     offset: int | None = Query(0),
+    after_rowid: int | None = Query(None),
+    columnar: bool = Query(False),
 ) -> dict[str, Any]:
     """Search textual columns synchronously with bounded pagination.
 
+    When ``after_rowid`` is supplied, results resume after that ``__rowid``
+    cursor instead of discarding ``offset`` rows, keeping deep paging O(limit).
+    With ``columnar`` matches are returned as one value array per column.
+
     Raises:
         HTTPException: The query is blank or the dataset requires a background job.
     """
@@ -104,17 +108,24 @@ def search(
         raise HTTPException(status_code=400, detail="query must not be empty")
     limit_value, offset_value = normalize_pagination(limit, offset)
 
+    columns = schema_for(path)
+    text_columns = [column["name"] for column in columns if "CHAR" in column["type"].upper() or "TEXT" in column["type"].upper()]
+    if not text_columns:
+        response = build_table_response(file, [column["name"] for column in columns], [], limit_value, offset_value, [])
+        return columnarize_table_response(response) if columnar is True else response
+    match_clause, match_params = search_match_clause(text_columns, search_term)
+    values = params + match_params
+    # Direct calls leave FastAPI's Query sentinel in place of an int, so only
+    # a real int engages the cursor.
+    if isinstance(after_rowid, int):
+        search_sql = f"SELECT * FROM ({relation}) WHERE {match_clause} AND __rowid > {int(after_rowid)} ORDER BY __rowid LIMIT {limit_value}"
+    else:
+        search_sql = f"SELECT * FROM ({relation}) WHERE {match_clause} LIMIT {limit_value} OFFSET {offset_value}"
     with open_connection() as connection:
-        base_relation, base_params = relation_sql(path)
-        columns = describe_relation(connection, base_relation, base_params)
-        text_columns = [column["name"] for column in columns if "CHAR" in column["type"].upper() or "TEXT" in column["type"].upper()]
-        if not text_columns:
-            return build_table_response(file, [column["name"] for column in columns], [], limit_value, offset_value, [])
-        like_clauses = " OR ".join(f"CAST({quote_ident(column)} AS VARCHAR) ILIKE ?" for column in text_columns)
-        values = params + [f"%{search_term}%"] * len(text_columns)
-        search_sql = f"SELECT * FROM ({relation}) WHERE {like_clauses} LIMIT {limit_value} OFFSET {offset_value}"
         result_columns, rows, row_ids = fetch_rows_with_rowid(connection, search_sql, values)
-    return build_table_response(file, result_columns, rows, limit_value, offset_value, row_ids)
+    response = build_table_response(file, result_columns, rows, limit_value, offset_value, row_ids)
+    # Like ``after_rowid``, ``columnar`` is a Query sentinel in direct calls.
+    return columnarize_table_response(response) if columnar is True else response
 
 
 @router.post("/api/query")
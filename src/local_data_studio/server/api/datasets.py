@@ -1,10 +1,15 @@
 """Dataset discovery, upload, preview, and sample endpoints."""
 
+import asyncio
 import datetime
 import mimetypes
+import os
+import shutil
+import sys
 from pathlib import Path
-from typing import Any
+from typing import Any, BinaryIO
 
+import duckdb
 from fastapi import APIRouter, File, HTTPException, Query, UploadFile
 from fastapi.responses import FileResponse
 
@@ -19,13 +24,13 @@ from ..config import (
     VIS_EXCLUDE_DIRS,
     VIS_EXCLUDE_FILES,
 )
-from ..db import open_connection, quote_ident, relation_sql
+from ..db import columnarize_table_response, open_connection, quote_ident, relation_sql
 from ..deleted_rows import deleted_row_ids_for
 from ..embedder_capabilities import library_versions
 from ..embedder_models import discover_embedder_models
 from ..files import refresh_dataset_file_catalog, resolve_data_file, resolve_raw_image_file, unique_path
 from ..readers import fetch_preview_page, fetch_raw_row, load_dataset_metadata
-from ..serialization import serialize_raw_value, serialize_value
+from ..serialization import serialize_column, serialize_raw_value, serialize_value
 from ..sql import fetch_raw_query_row_guarded
 from .schemas import RawRowRequest
 from .services import reject_large_sync_operation
@@ -75,9 +80,37 @@ def raw_file(path: str = Query(..., description="Absolute file path on the serve
     return FileResponse(str(resolved), media_type=media_type or "application/octet-stream")
 
 
+def _copy_upload_to_disk(source: BinaryIO, destination: Path) -> None:
+    """Copy a spooled upload to its destination without Python-space chunking.
+
+    Uploads that Starlette already rolled to a real temp file are forwarded
+    fd-to-fd with ``os.sendfile``, so the bytes never enter Python objects.
+    Only Linux allows a regular file as the sendfile destination, so other
+    platforms — and in-memory spools — use ``shutil.copyfileobj`` with
+    4 MiB buffers.
+    """
+    source.seek(0)
+    # ``_rolled`` is private to SpooledTemporaryFile; when absent, assume an
+    # in-memory spool so the copy stays on the safe buffered path.
+    rolled = getattr(source, "_rolled", False)
+    with destination.open("wb") as output:
+        if rolled and sys.platform == "linux":
+            in_fd = source.fileno()
+            remaining = os.fstat(in_fd).st_size
+            offset = 0
+            while remaining > 0:
+                sent = os.sendfile(output.fileno(), in_fd, offset, remaining)
+                if sent == 0:
+                    break
+                offset += sent
+                remaining -= sent
+        else:
+            shutil.copyfileobj(source, output, 4 * 1024 * 1024)
+
+
 @router.post("/api/upload")
 async def upload_files(files: list[UploadFile] = UPLOAD_FILES) -> dict[str, Any]:
-    """Stream supported uploads into the data directory in 1 MiB chunks.
+    """Copy supported uploads into the data directory off the event loop.
 
     Filenames are reduced to their basename and collisions receive a unique suffix.
     Unsupported uploads are closed and reported without being written.
@@ -100,9 +133,7 @@ async def upload_files(files: list[UploadFile] = UPLOAD_FILES) -> dict[str, Any]
             await upload.close()
             continue
         destination = unique_path(DATA_ROOT, filename)
-        with destination.open("wb") as output:
-            while chunk := await upload.read(1024 * 1024):
-                output.write(chunk)
+        await asyncio.to_thread(_copy_upload_to_disk, upload.file, destination)
         await upload.close()
         saved.append(destination.name)
 
@@ -125,10 +156,27 @@ def preview(
     limit: int | None = Query(DEFAULT_LIMIT),
     offset: int | None = Query(0),
     page_token: str | None = Query(None),
+    after_rowid: int | None = Query(None),
+    columnar: bool = Query(False),
 ) -> dict[str, Any]:
-    """Return one bounded preview page using a cursor token when supplied."""
+    """Return one bounded preview page using a cursor token when supplied.
+
+    With ``columnar`` the page is returned as one value array per column
+    (``columns_data``) instead of row lists, which serializes with one array
+    per column rather than one list per row.
+    """
     path = resolve_data_file(file)
-    return fetch_preview_page(file, path, limit=limit, offset=offset, page_token=page_token, deleted_ids=deleted_row_ids_for(path))
+    response = fetch_preview_page(
+        file,
+        path,
+        limit=limit,
+        offset=offset,
+        page_token=page_token,
+        deleted_ids=deleted_row_ids_for(path),
+        after_rowid=after_rowid,
+    )
+    # Direct calls leave FastAPI's truthy Query sentinel in ``columnar``.
+    return columnarize_table_response(response) if columnar is True else response
 
 
 @router.post("/api/raw_row")
@@ -172,5 +220,8 @@ def column_sample(
             f"SELECT {quoted_column} FROM {relation} WHERE {quoted_column} IS NOT NULL LIMIT {limit_value}",
             params,
         )
-        rows = [serialize_value(row[0]) for row in sample.fetchall()]
-    return {"file": file, "column": column, "values": rows}
+        try:
+            values = serialize_column(sample.to_arrow_table().column(0))
+        except duckdb.Error:
+            values = [serialize_value(row[0]) for row in sample.fetchall()]
+    return {"file": file, "column": column, "values": values}
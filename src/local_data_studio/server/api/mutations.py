@@ -7,10 +7,10 @@ from fastapi import APIRouter, HTTPException
 
 from ..config import ALLOW_DELETE_DATA, HARD_DELETE_MAX_BYTES
 from ..db import count_relation_rows_raw
-from ..delete_ops import delete_column_from_file, delete_row_from_file
-from ..deleted_rows import add_deleted_row_id, clear_deleted_row_ids, deleted_row_ids_for
+from ..delete_ops import compact_deleted_rows_in_file, delete_column_from_file, delete_row_from_file
+from ..deleted_rows import add_deleted_row_id, clear_deleted_row_ids
 from ..files import resolve_data_file
-from .schemas import DeleteColumnRequest, DeleteRowRequest
+from .schemas import CompactDeletedRowsRequest, DeleteColumnRequest, DeleteRowRequest
 
 router = APIRouter()
 
@@ -43,8 +43,19 @@ def delete_row(payload: DeleteRowRequest) -> dict[str, Any]:
         delete_row_from_file(path, row_id)
         clear_deleted_row_ids(path)
         return {"file": payload.file, "row_id": row_id, "persisted": True, "total_rows": max(0, total_rows - 1)}
-    add_deleted_row_id(path, row_id)
-    return {"file": payload.file, "row_id": row_id, "persisted": False, "deleted_count": len(deleted_row_ids_for(path))}
+    deleted_count = add_deleted_row_id(path, row_id)
+    return {"file": payload.file, "row_id": row_id, "persisted": False, "deleted_count": deleted_count}
+
+
+@router.post("/api/compact_deleted_rows")
+def compact_deleted_rows(payload: CompactDeletedRowsRequest) -> dict[str, Any]:
+    """Apply every session-deleted row to the file in one rewrite pass."""
+    path = resolve_data_file(payload.file)
+    if not ALLOW_DELETE_DATA:
+        raise HTTPException(status_code=403, detail="delete from file is disabled")
+    _reject_large_hard_delete(path)
+    compacted = compact_deleted_rows_in_file(path)
+    return {"file": payload.file, "persisted": True, "compacted_rows": compacted}
 
 
 @router.post("/api/delete_column")
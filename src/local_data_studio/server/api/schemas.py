@@ -100,6 +100,12 @@ class DeleteRowRequest(BaseModel):
     persist: bool | None = None
 
 
+class CompactDeletedRowsRequest(BaseModel):
+    """Input for persisting all session-deleted rows in one rewrite."""
+
+    file: str = Field(min_length=1)
+
+
 class DeleteColumnRequest(BaseModel):
     """Input for soft or persistent column deletion."""
 
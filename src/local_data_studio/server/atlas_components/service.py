@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Collection
 from dataclasses import replace
 from pathlib import Path
 from typing import Any
@@ -36,7 +37,7 @@ def resolve_embedder_model(model: str) -> Path:
     return embedder_models.resolve_embedder_model(model, EMBEDDER_MODELS_DIR)
 
 
-def _sample_column_values(path: Path, column: str, sql: str | None, deleted_ids: list[int]) -> list[Any]:
+def _sample_column_values(path: Path, column: str, sql: str | None, deleted_ids: Collection[int]) -> list[Any]:
     with open_connection() as connection:
         configure_duckdb_limits(connection)
         create_data_view(connection, path, deleted_ids)
@@ -54,7 +55,7 @@ def infer_atlas_modality(
     path: Path,
     column: str,
     sql: str | None = None,
-    deleted_ids: list[int] | None = None,
+    deleted_ids: Collection[int] | None = None,
 ) -> AtlasModality:
     """Infer whether Atlas should treat the selected column as image or text."""
     values = _sample_column_values(path, column, sql, deleted_ids or [])
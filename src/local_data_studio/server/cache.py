@@ -6,7 +6,7 @@ import hashlib
 import json
 import stat as stat_module
 import threading
-from collections.abc import Iterable
+from collections.abc import Collection, Iterable
 from dataclasses import dataclass
 from pathlib import Path
 
@@ -121,7 +121,7 @@ def _operation_cache_key(path: Path, payload: dict[str, object]) -> str:
     return hashlib.sha256(f"{fingerprint}|{encoded_payload}".encode()).hexdigest()
 
 
-def count_cache_path(path: Path, *, deleted_ids: list[int]) -> Path:
+def count_cache_path(path: Path, *, deleted_ids: Collection[int]) -> Path:
     """Return the cached count result path for a dataset and soft-delete state."""
     key = _operation_cache_key(path, {"deleted_ids": sorted(deleted_ids)})
     return COUNT_CACHE_DIR / f"{key}.json"
@@ -132,7 +132,7 @@ def index_cache_path(path: Path) -> Path:
     return INDEX_CACHE_DIR / f"{DatasetFingerprint.from_path(path).key}.sqlite"
 
 
-def search_cache_path(path: Path, *, query: str, limit: int, deleted_ids: list[int]) -> Path:
+def search_cache_path(path: Path, *, query: str, limit: int, deleted_ids: Collection[int]) -> Path:
     """Return the cached search result path for a dataset and search parameters."""
     key = _operation_cache_key(path, {"query": query, "limit": limit, "deleted_ids": sorted(deleted_ids)})
     return SEARCH_CACHE_DIR / f"{key}.json"
@@ -14,6 +14,7 @@ from .heuristics import (
     looks_like_url,
     number_type_label,
     numeric_histogram,
+    numeric_histogram_with_range,
 )
 from .service import compute_column_stats
 
@@ -32,4 +33,5 @@ __all__ = [
     "looks_like_url",
     "number_type_label",
     "numeric_histogram",
+    "numeric_histogram_with_range",
 ]
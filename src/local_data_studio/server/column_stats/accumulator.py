@@ -7,7 +7,15 @@ from collections import Counter
 from dataclasses import dataclass, field
 from typing import Any
 
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+
 from .heuristics import (
+    PATH_CHAR_PATTERN,
+    URL_PREFIX_PATTERN,
+    column_name_suggests_path,
+    column_name_suggests_url,
     discrete_counts,
     format_axis,
     is_class_like_column,
@@ -15,7 +23,7 @@ from .heuristics import (
     looks_like_path,
     looks_like_url,
     number_type_label,
-    numeric_histogram,
+    numeric_histogram_with_range,
 )
 
 KIND_PRIORITY = ("dict", "list", "string", "number", "boolean", "other")
@@ -28,12 +36,18 @@ class ColumnSampleAccumulator:
     Mappings and other structured cells are not retained. Strings are retained once
     per distinct value for class frequencies; numeric values and collection lengths
     remain owned because histogram boundaries are known only after sampling.
+    Numeric values arriving as Arrow chunks are kept as typed NumPy arrays so
+    histogram and tally passes never box them; the scalar ``add`` path buffers
+    into plain lists and both representations merge when the response is built.
     """
 
+    column_name: str = ""
     non_null_count: int = 0
     kinds: set[str] = field(default_factory=set)
     numeric_values: list[float] = field(default_factory=list)
     integer_values: list[int] = field(default_factory=list)
+    numeric_chunks: list[Any] = field(default_factory=list)
+    integer_chunks: list[Any] = field(default_factory=list)
     truthy_count: int = 0
     string_counts: Counter[str] = field(default_factory=Counter)
     string_lengths: list[int] = field(default_factory=list)
@@ -68,6 +82,104 @@ class ColumnSampleAccumulator:
         else:
             self.kinds.add("other")
 
+    def add_arrow_column(self, column: Any) -> None:
+        """Consume one Arrow column chunk, vectorizing typed scalar columns.
+
+        Nulls are dropped once up front; recognized chunk types then update
+        the tallies with NumPy array operations and Arrow kernels, and only
+        unrecognized types fall back to the per-value ``add`` path.
+        """
+        values = column.drop_null()
+        if len(values) == 0:
+            return
+        column_type = column.type
+        if pa.types.is_integer(column_type):
+            array = values.to_numpy(zero_copy_only=False)
+            self.non_null_count += len(array)
+            self.kinds.add("number")
+            self.truthy_count += int(np.count_nonzero(array))
+            self.integer_chunks.append(array)
+            self.numeric_chunks.append(array.astype(np.float64))
+        elif pa.types.is_floating(column_type):
+            array = np.asarray(values.to_numpy(zero_copy_only=False), dtype=np.float64)
+            self.non_null_count += len(array)
+            self.kinds.add("number")
+            self.truthy_count += int(np.count_nonzero(array))
+            self.numeric_chunks.append(array)
+        elif pa.types.is_string(column_type) or pa.types.is_large_string(column_type):
+            self.non_null_count += len(values)
+            self.kinds.add("string")
+            # Arrow's RE2 kernels run the URL/path predicates over the whole
+            # chunk instead of one Python regex call per string. The labels
+            # short-circuit on the column name, so a URL-named column skips
+            # both scans; a path-named column still needs the URL scan
+            # because a high URL ratio outranks the path label.
+            name_suggests_url = bool(self.column_name) and column_name_suggests_url(self.column_name)
+            if not name_suggests_url:
+                # pyarrow.compute materializes its kernels at import time, so
+                # static checkers cannot resolve them as module attributes.
+                url_matches = pc.match_substring_regex(values, URL_PREFIX_PATTERN, ignore_case=True)  # ty: ignore[unresolved-attribute]
+                self.url_count += pc.sum(url_matches).as_py() or 0  # ty: ignore[unresolved-attribute]
+                if not (self.column_name and column_name_suggests_path(self.column_name)):
+                    path_matches = pc.and_(  # ty: ignore[unresolved-attribute]
+                        pc.match_substring_regex(values, PATH_CHAR_PATTERN),  # ty: ignore[unresolved-attribute]
+                        pc.invert(pc.match_substring(values, "://")),  # ty: ignore[unresolved-attribute]
+                    )
+                    self.path_count += pc.sum(path_matches).as_py() or 0  # ty: ignore[unresolved-attribute]
+            # utf8_length counts code points like Python's len, vectorized
+            # over the Arrow buffer; zero-length strings are the falsy ones.
+            lengths = pc.utf8_length(values).to_numpy(zero_copy_only=False)  # ty: ignore[unresolved-attribute]
+            self.truthy_count += int(np.count_nonzero(lengths))
+            self.string_lengths.extend(lengths.tolist())
+            # One C-level counting pass replaces a per-value dict update; the
+            # sample is bounded, so exact counts stay cheaper and truer than
+            # an approximate top-k sketch pushed into SQL.
+            self.string_counts.update(values.to_pylist())
+        elif pa.types.is_decimal(column_type):
+            array = pc.cast(values, pa.float64()).to_numpy(zero_copy_only=False)
+            self.non_null_count += len(array)
+            self.kinds.add("number")
+            self.truthy_count += int(np.count_nonzero(array))
+            self.numeric_chunks.append(array)
+        elif pa.types.is_boolean(column_type):
+            array = values.to_numpy(zero_copy_only=False)
+            self.non_null_count += len(array)
+            self.kinds.add("boolean")
+            self.truthy_count += int(np.count_nonzero(array))
+        elif pa.types.is_list(column_type) or pa.types.is_large_list(column_type) or pa.types.is_fixed_size_list(column_type):
+            lengths = pc.list_value_length(values).to_numpy(zero_copy_only=False)  # ty: ignore[unresolved-attribute]
+            self.non_null_count += len(values)
+            self.kinds.add("list")
+            self.truthy_count += int(np.count_nonzero(lengths))
+            self.list_lengths.extend(lengths.tolist())
+        elif pa.types.is_struct(column_type):
+            self.non_null_count += len(values)
+            self.kinds.add("dict")
+            if column_type.num_fields:
+                self.truthy_count += len(values)
+        else:
+            for value in values.to_pylist():
+                self.add(value)
+
+    def _numeric_count(self) -> int:
+        return len(self.numeric_values) + sum(len(chunk) for chunk in self.numeric_chunks)
+
+    def _integer_count(self) -> int:
+        return len(self.integer_values) + sum(len(chunk) for chunk in self.integer_chunks)
+
+    def _merged_numeric_values(self) -> Any:
+        parts = [np.asarray(self.numeric_values, dtype=np.float64)] if self.numeric_values else []
+        parts.extend(self.numeric_chunks)
+        if len(parts) == 1:
+            return parts[0]
+        return np.concatenate(parts)
+
+    def _merged_integer_values(self) -> list[int]:
+        merged = list(self.integer_values)
+        for chunk in self.integer_chunks:
+            merged.extend(chunk.tolist())
+        return merged
+
     def inferred_kind(self) -> str:
         """Return the historical highest-priority kind in the bounded sample."""
         if not self.kinds:
@@ -100,11 +212,12 @@ class ColumnSampleAccumulator:
         return response
 
     def _number_response(self, name: str, column_type: str) -> dict[str, Any]:
-        if not self.numeric_values:
+        numeric_count = self._numeric_count()
+        if not numeric_count:
             return {"name": name, "kind": "number", "label": "number", "bins": []}
-        is_integer = is_integer_type(column_type) and len(self.integer_values) == len(self.numeric_values)
+        is_integer = is_integer_type(column_type) and self._integer_count() == numeric_count
         if is_integer:
-            bins, labels, axis = discrete_counts(self.integer_values)
+            bins, labels, axis = discrete_counts(self._merged_integer_values())
             return {
                 "name": name,
                 "kind": "number",
@@ -113,24 +226,22 @@ class ColumnSampleAccumulator:
                 "axis": axis,
                 "labels": labels,
             }
+        bins, min_val, max_val = numeric_histogram_with_range(self._merged_numeric_values())
         return {
             "name": name,
             "kind": "number",
             "label": number_type_label(column_type, is_integer=False),
-            "bins": numeric_histogram(self.numeric_values),
-            "axis": format_axis(min(self.numeric_values), max(self.numeric_values)),
+            "bins": bins,
+            "axis": format_axis(min_val, max_val),
         }
 
     def _string_response(self, name: str) -> dict[str, Any]:
         if not self.string_lengths:
             return {"name": name, "kind": "string", "label": "string", "bins": []}
         string_label = None
-        if any(token in name.lower() for token in ("url", "uri", "href", "link")) or self.url_count / len(self.string_lengths) >= 0.4:
+        if column_name_suggests_url(name) or self.url_count / len(self.string_lengths) >= 0.4:
             string_label = "string / url"
-        elif (
-            any(token in name.lower() for token in ("path", "file", "filename", "filepath", "dir", "folder"))
-            or self.path_count / len(self.string_lengths) >= 0.4
-        ):
+        elif column_name_suggests_path(name) or self.path_count / len(self.string_lengths) >= 0.4:
             string_label = "string / path"
         if is_class_like_column(name, len(self.string_counts), len(self.string_lengths)):
             return {
@@ -140,12 +251,13 @@ class ColumnSampleAccumulator:
                 "bins": [count for _, count in self.string_counts.most_common(8)],
                 "note": f"{len(self.string_counts)} values",
             }
+        bins, min_length, max_length = numeric_histogram_with_range(self.string_lengths)
         return {
             "name": name,
             "kind": "string",
             "label": string_label or "string / length",
-            "bins": numeric_histogram([float(value) for value in self.string_lengths]),
-            "axis": format_axis(min(self.string_lengths), max(self.string_lengths)),
+            "bins": bins,
+            "axis": format_axis(int(min_length), int(max_length)),
         }
 
     def _list_response(self, name: str) -> dict[str, Any]:
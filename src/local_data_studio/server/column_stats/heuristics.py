@@ -1,28 +1,41 @@
 """Pure inference helpers for sampled column values."""
 
 import decimal
+import functools
+import re
 from collections import Counter
+from collections.abc import Sequence
 from typing import Any
 
+import numpy as np
 
-def numeric_histogram(values: list[float], bins: int = 8) -> list[int]:
+
+def numeric_histogram(values: "Sequence[float] | np.ndarray", bins: int = 8) -> list[int]:
     """Return histogram bin counts for numeric values."""
-    if not values:
-        return []
+    return numeric_histogram_with_range(values, bins)[0]
+
+
+def numeric_histogram_with_range(values: "Sequence[float] | np.ndarray", bins: int = 8) -> tuple[list[int], float, float]:
+    """Return histogram bin counts plus the observed minimum and maximum.
+
+    Bin indices are computed for the whole sample in one vectorized NumPy
+    pass instead of unboxing each value in a Python loop; truncation and
+    edge clamping match the previous per-value arithmetic exactly. The
+    min/max found for the bin edges are returned so callers building axis
+    labels do not rescan the values, which may be a list or a NumPy array.
+    """
+    if len(values) == 0:
+        return [], 0.0, 0.0
+    array = np.asarray(values, dtype=np.float64)
+    min_val = float(array.min())
+    max_val = float(array.max())
     if len(values) == 1:
-        return [1]
-    min_val = min(values)
-    max_val = max(values)
+        return [1], min_val, max_val
     if min_val == max_val:
-        return [len(values)]
-    span = max_val - min_val
-    width = span / bins if span else 1.0
-    counts = [0] * bins
-    for value in values:
-        index = int((value - min_val) / width) if width else 0
-        index = min(bins - 1, max(0, index))
-        counts[index] += 1
-    return counts
+        return [len(values)], min_val, max_val
+    scale = bins / (max_val - min_val)
+    indices = np.clip(((array - min_val) * scale).astype(np.intp), 0, bins - 1)
+    return np.bincount(indices, minlength=bins).tolist(), min_val, max_val
 
 
 def format_number(value: float) -> str:
@@ -65,91 +78,126 @@ def infer_kind(values: list[Any]) -> str:
     return result
 
 
+# DuckDB integer type names are prefix-distinguishable, so one C-level
+# startswith over the tuple replaces nine sequential substring scans; this
+# also stops nested types such as STRUCT(k INTEGER) from classifying their
+# parent column as integer.
+_INTEGER_TYPE_TOKENS = (
+    "UTINYINT",
+    "USMALLINT",
+    "UINTEGER",
+    "UBIGINT",
+    "TINYINT",
+    "SMALLINT",
+    "INTEGER",
+    "BIGINT",
+    "HUGEINT",
+)
+
+_INTEGER_TYPE_LABELS = {
+    "UTINYINT": "uint8",
+    "USMALLINT": "uint16",
+    "UINTEGER": "uint32",
+    "UBIGINT": "uint64",
+    "TINYINT": "int8",
+    "SMALLINT": "int16",
+    "INTEGER": "int32",
+    "BIGINT": "int64",
+    "HUGEINT": "int128",
+}
+
+
+@functools.lru_cache(maxsize=128)
 def is_integer_type(type_name: str) -> bool:
-    """Check whether a DuckDB type string is integer-like."""
-    if not type_name:
-        return False
-    upper = type_name.upper()
-    return any(
-        token in upper
-        for token in (
-            "UTINYINT",
-            "USMALLINT",
-            "UINTEGER",
-            "UBIGINT",
-            "TINYINT",
-            "SMALLINT",
-            "INTEGER",
-            "BIGINT",
-            "HUGEINT",
-        )
-    )
+    """Check whether a DuckDB type string is integer-like.
+
+    Distinct type strings across a workload number in the dozens, so a small
+    cache turns repeated classification into a dictionary hit.
+    """
+    return bool(type_name) and type_name.upper().startswith(_INTEGER_TYPE_TOKENS)
 
 
+@functools.lru_cache(maxsize=128)
 def number_type_label(type_name: str, is_integer: bool) -> str:
     """Map DuckDB type strings to compact dtype labels."""
     upper = (type_name or "").upper()
 
-    label = "float"
     if is_integer:
-        label = "int"
-        patterns: list[tuple[str, str]] = [
-            ("UTINYINT", "uint8"),
-            ("USMALLINT", "uint16"),
-            ("UINTEGER", "uint32"),
-            ("UBIGINT", "uint64"),
-            ("TINYINT", "int8"),
-            ("SMALLINT", "int16"),
-            ("INTEGER", "int32"),
-            ("BIGINT", "int64"),
-            ("HUGEINT", "int128"),
-        ]
-        for pattern, mapped in patterns:
-            if pattern in upper:
-                label = mapped
-                break
-    elif "DOUBLE" in upper:
-        label = "float64"
-    elif "REAL" in upper or "FLOAT" in upper:
-        label = "float32"
-    elif "DECIMAL" in upper or "NUMERIC" in upper:
-        label = "decimal"
+        for token, label in _INTEGER_TYPE_LABELS.items():
+            if upper.startswith(token):
+                return label
+        return "int"
+    if upper.startswith("DOUBLE"):
+        return "float64"
+    if upper.startswith(("REAL", "FLOAT")):
+        return "float32"
+    if upper.startswith(("DECIMAL", "NUMERIC")):
+        return "decimal"
+    return "float"
+
 
-    return label
+_CLASS_NAME_TOKENS = ("label", "class", "category", "source", "type", "tag")
+_URL_NAME_TOKENS = ("url", "uri", "href", "link")
+_PATH_NAME_TOKENS = ("path", "file", "filename", "filepath", "dir", "folder")
+
+
+@functools.lru_cache(maxsize=256)
+def column_name_suggests_class(name: str) -> bool:
+    """Return whether a column name marks it as class- or label-like.
+
+    The name checks are cached because the same column names recur across
+    stats requests; one lowercase copy per distinct name replaces one per
+    call per heuristic.
+    """
+    lowered = name.lower()
+    return any(token in lowered for token in _CLASS_NAME_TOKENS)
+
+
+@functools.lru_cache(maxsize=256)
+def column_name_suggests_url(name: str) -> bool:
+    """Return whether a column name marks it as URL-like."""
+    lowered = name.lower()
+    return any(token in lowered for token in _URL_NAME_TOKENS)
+
+
+@functools.lru_cache(maxsize=256)
+def column_name_suggests_path(name: str) -> bool:
+    """Return whether a column name marks it as path-like."""
+    lowered = name.lower()
+    return any(token in lowered for token in _PATH_NAME_TOKENS)
 
 
 def is_class_like_column(name: str, distinct: int, total: int) -> bool:
     """Heuristically identify class or label string columns."""
-    lowered = name.lower()
-    keywords = ("label", "class", "category", "source", "type", "tag")
-    if any(keyword in lowered for keyword in keywords):
+    if column_name_suggests_class(name):
         return True
     if distinct <= 20:
         return True
     return total > 0 and distinct <= 50 and (distinct / total) <= 0.3
 
 
+# Shared with the Arrow batch matcher in the accumulator; both patterns are
+# valid for Python's re and for RE2, which Arrow compute uses.
+URL_PREFIX_PATTERN = r"^\s*(?:https?://|data:image)"
+PATH_CHAR_PATTERN = r"^~|[\\/]"
+
+_URL_PREFIX_RE = re.compile(URL_PREFIX_PATTERN, re.IGNORECASE)
+_PATH_CHAR_RE = re.compile(PATH_CHAR_PATTERN)
+
+
 def looks_like_url(value: str) -> bool:
     """Return whether a string resembles a supported URL value."""
-    lower = value.strip().lower()
-    if not lower:
-        return False
-    return lower.startswith(("http://", "https://", "data:image"))
+    return _URL_PREFIX_RE.match(value) is not None
 
 
 def looks_like_path(value: str) -> bool:
     """Return whether a string resembles a local file path."""
-    if not value or "://" in value:
-        return False
-    if value.startswith(("./", "../", "/", "~")):
-        return True
-    return "\\" in value or "/" in value
+    return "://" not in value and _PATH_CHAR_RE.search(value) is not None
 
 
 def is_url_like_column(name: str, values: list[str]) -> bool:
     """Heuristically identify URL-like string columns."""
-    lowered = name.lower()
-    if any(token in lowered for token in ("url", "uri", "href", "link")):
+    if column_name_suggests_url(name):
         return True
     if not values:
         return False
@@ -159,8 +207,7 @@ def is_url_like_column(name: str, values: list[str]) -> bool:
 
 def is_path_like_column(name: str, values: list[str]) -> bool:
     """Heuristically identify path-like string columns."""
-    lowered = name.lower()
-    if any(token in lowered for token in ("path", "file", "filename", "filepath", "dir", "folder")):
+    if column_name_suggests_path(name):
         return True
     if not values:
         return False
@@ -174,14 +221,40 @@ def format_axis(left: float, right: float) -> dict[str, str]:
 
 
 def discrete_counts(values: list[int], max_bins: int = 12) -> tuple[list[int], list[str] | None, dict[str, str] | None]:
-    """Return discrete bins or a numeric histogram when values are numerous."""
+    """Return discrete bins or a numeric histogram when values are numerous.
+
+    Typical inputs (list lengths, class ids) span a handful of consecutive
+    integers, so a shifted ``np.bincount`` counts them without Counter's
+    per-value hashing; only present values keep labels, matching the Counter
+    output exactly. Wide or oversized ranges fall back to the hashed path.
+    """
     if not values:
         return [], None, None
-    counts = Counter(values)
-    if len(counts) <= max_bins:
-        ordered = sorted(counts.keys())
+    try:
+        array = np.asarray(values, dtype=np.int64)
+    except OverflowError:
+        array = None
+    if array is not None:
+        low = int(array.min())
+        span = int(array.max()) - low + 1
+        if span <= 256:
+            full = np.bincount(array - low, minlength=span)
+            present = np.flatnonzero(full)
+            if len(present) <= max_bins:
+                labels = [str(low + int(offset)) for offset in present]
+                return full[present].tolist(), labels, None
+            # The histogram fallback only needs a bin index per *possible*
+            # value, so evaluate numeric_histogram's float binning once per
+            # offset as a lookup table and fold the value counts through it.
+            scale = 8 / float(span - 1)
+            lut = np.clip((np.arange(span, dtype=np.float64) * scale).astype(np.intp), 0, 7)
+            histogram = np.bincount(lut, weights=full, minlength=8).astype(np.int64)
+            return histogram.tolist(), None, format_axis(low, low + span - 1)
+    counted = Counter(values)
+    if len(counted) <= max_bins:
+        ordered = sorted(counted.keys())
         labels = [str(value) for value in ordered]
-        bins = [counts[value] for value in ordered]
+        bins = [counted[value] for value in ordered]
         return bins, labels, None
     bins = numeric_histogram([float(value) for value in values], bins=8)
     return bins, None, format_axis(min(values), max(values))
@@ -3,6 +3,8 @@
 from pathlib import Path
 from typing import Any
 
+import duckdb
+
 from ..config import DEFAULT_SAMPLE, MAX_SAMPLE
 from ..db import describe_relation, open_connection, relation_sql
 from .accumulator import ColumnSampleAccumulator
@@ -13,9 +15,12 @@ STATS_FETCH_BATCH_SIZE = 1_024
 def compute_column_stats(file: str, path: Path, sample: int | None) -> dict[str, Any]:
     """Compute column summaries without retaining the sampled row matrix.
 
-    At most the configured sample size is read. Values are fetched from DuckDB in
-    fixed batches and transferred into per-column accumulators; the connection and
-    cursor remain owned by this function and are closed before the response returns.
+    At most the configured sample size is read. Values stream from DuckDB as
+    fixed-size Arrow record batches and are consumed column-by-column by the
+    per-column accumulators, so no row-major tuple matrix is boxed or
+    transposed; the connection and cursor remain owned by this function and
+    are closed before the response returns. Results whose types cannot cross
+    the Arrow boundary fall back to the row-tuple batch loop.
 
     Args:
         file: User-facing allowlisted dataset name copied into the response.
@@ -38,13 +43,21 @@ def compute_column_stats(file: str, path: Path, sample: int | None) -> dict[str,
         result = connection.execute(f"SELECT * FROM {relation} LIMIT {sample_size}", params)
         description = result.description or []
         column_names = [item[0] for item in description]
-        accumulators = [ColumnSampleAccumulator() for _ in column_names]
+        accumulators = [ColumnSampleAccumulator(column_name=name) for name in column_names]
         sampled_rows = 0
-        while rows := result.fetchmany(STATS_FETCH_BATCH_SIZE):
-            sampled_rows += len(rows)
-            for row in rows:
-                for accumulator, value in zip(accumulators, row):
-                    accumulator.add(value)
+        try:
+            reader = result.to_arrow_reader(STATS_FETCH_BATCH_SIZE)
+        except duckdb.Error:
+            while rows := result.fetchmany(STATS_FETCH_BATCH_SIZE):
+                sampled_rows += len(rows)
+                for row in rows:
+                    for accumulator, value in zip(accumulators, row):
+                        accumulator.add(value)
+        else:
+            for batch in reader:
+                sampled_rows += batch.num_rows
+                for accumulator, column in zip(accumulators, batch.columns):
+                    accumulator.add_arrow_column(column)
 
     if sampled_rows == 0:
         return {"file": file, "columns": [], "sample": 0}
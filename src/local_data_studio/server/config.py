@@ -3,10 +3,11 @@
 from __future__ import annotations
 
 import os
+from collections.abc import Mapping
+from dataclasses import dataclass
 from pathlib import Path
 
-from pydantic import Field, field_validator, model_validator
-from pydantic_settings import BaseSettings, SettingsConfigDict
+from dotenv import load_dotenv
 
 from ..runtime_config import apply_settings_environment, read_runtime_config
 
@@ -15,147 +16,141 @@ BASE_DIR: Path = Path(os.environ.get("LOCAL_DATA_STUDIO_WORKSPACE_DIR") or Path.
 ENV_FILE: Path = Path(os.environ.get("LOCAL_DATA_STUDIO_ENV_FILE") or BASE_DIR / ".env").expanduser().resolve()
 
 
-class Settings(BaseSettings):
-    """Typed application settings loaded from environment variables."""
-
-    model_config = SettingsConfigDict(env_file=str(ENV_FILE), case_sensitive=False, extra="ignore")
-
-    data_file: str | None = Field(default=None, validation_alias="DATA_FILE")
-    data_dir: str = Field(default=str(BASE_DIR / "data"), validation_alias="DATA_DIR")
-    cache_dir: str = Field(default=str(BASE_DIR / "cache"), validation_alias="CACHE_DIR")
-    embedder_models_dir: str = Field(default=str(BASE_DIR / "models" / "embedder"), validation_alias="EMBEDDER_MODELS_DIR")
-    default_eda_sample: int = Field(default=5000, validation_alias="EDA_ROW_LIMIT")
-    allow_delete_data: bool = Field(default=True, validation_alias="ALLOW_DELETE_DATA")
-    eda_cell_max_chars: int = Field(default=5000, validation_alias="EDA_CELL_MAX_CHARS")
-    eda_nested_policy: str = Field(default="stringify", validation_alias="EDA_NESTED_POLICY")
-    eda_cache_max_bytes: int = Field(default=1024 * 1024 * 1024, validation_alias="EDA_CACHE_MAX_BYTES")
-    atlas_host: str = Field(default="127.0.0.1", validation_alias="ATLAS_HOST")
-    atlas_port: int = Field(default=5055, validation_alias="ATLAS_PORT")
-    atlas_max_instances: int = Field(default=4, validation_alias="ATLAS_MAX_INSTANCES")
-    atlas_sample: int = Field(default=0, validation_alias="ATLAS_SAMPLE")
-    atlas_batch_size: int = Field(default=0, validation_alias="ATLAS_BATCH_SIZE")
-    atlas_cache_max_bytes: int = Field(default=10 * 1024 * 1024 * 1024, validation_alias="ATLAS_CACHE_MAX_BYTES")
-    atlas_text_max_chars: int = Field(default=4096, validation_alias="ATLAS_TEXT_MAX_CHARS")
-    atlas_embedding_dtype: str = Field(default="float32", validation_alias="ATLAS_EMBEDDING_DTYPE")
-    atlas_umap_projection_mode: str = Field(default="full", validation_alias="ATLAS_UMAP_PROJECTION_MODE")
-    atlas_umap_anchor_sample: int = Field(default=10000, validation_alias="ATLAS_UMAP_ANCHOR_SAMPLE")
-    legacy_atlas_projection_mode: str | None = Field(default=None, validation_alias="ATLAS_PROJECTION_MODE", exclude=True)
-    legacy_atlas_anchor_sample: int | None = Field(default=None, validation_alias="ATLAS_ANCHOR_SAMPLE", exclude=True)
-    atlas_trust_remote_code: bool = Field(default=False, validation_alias="ATLAS_TRUST_REMOTE_CODE")
-    file_serve_roots: str | None = Field(
-        default=None,
-        validation_alias="FILE_SERVE_ROOTS",
-        description="Comma-separated list of absolute directories from which /api/raw may serve files.",
-    )
-    vis_exclude_dirs: str | None = Field(
-        default=None,
-        validation_alias="VIS_EXCLUDE_DIRS",
-        description="Comma-separated list of directories to exclude from dataset discovery under DATA_DIR.",
-    )
-    vis_exclude_files: str | None = Field(
-        default=None,
-        validation_alias="VIS_EXCLUDE_FILES",
-        description="Comma-separated list of files to exclude from dataset discovery under DATA_DIR.",
-    )
-
-    @field_validator("data_file", mode="before")
-    @classmethod
-    def normalize_data_file(cls, value: str | None) -> str | None:
-        """Treat a blank single-file setting as unset."""
-        if value is None:
-            return None
-        if isinstance(value, str) and not value.strip():
-            return None
-        return value
-
-    @field_validator("default_eda_sample")
-    @classmethod
-    def validate_eda_row_limit(cls, value: int) -> int:
-        """Accept an unlimited marker or any positive EDA row limit."""
-        if value == -1 or value >= 1:
-            return value
-        raise ValueError("EDA_ROW_LIMIT must be -1 or an integer greater than or equal to 1")
-
-    @field_validator("eda_nested_policy", mode="before")
-    @classmethod
-    def normalize_nested_policy(cls, value: str | None) -> str:
-        """Normalize the nested-value policy to a lowercase non-empty value."""
-        return (value or "stringify").strip().lower()
-
-    @field_validator("atlas_embedding_dtype", mode="before")
-    @classmethod
-    def normalize_atlas_embedding_dtype(cls, value: str | None) -> str:
-        """Accept only float32 or float16 Atlas embedding storage."""
-        normalized = (value or "float32").strip().lower()
-        if normalized not in {"float32", "float16"}:
+@dataclass(frozen=True, slots=True)
+class Settings:
+    """Typed application settings built once from environment variables.
+
+    Fields are plain dataclass attributes; ``__post_init__`` applies the same
+    normalization and validation the former pydantic validators did, without
+    importing validator machinery on every worker start.
+    """
+
+    data_file: str | None = None
+    data_dir: str = str(BASE_DIR / "data")
+    cache_dir: str = str(BASE_DIR / "cache")
+    embedder_models_dir: str = str(BASE_DIR / "models" / "embedder")
+    default_eda_sample: int = 5000
+    allow_delete_data: bool = True
+    eda_cell_max_chars: int = 5000
+    eda_nested_policy: str = "stringify"
+    eda_cache_max_bytes: int = 1024 * 1024 * 1024
+    atlas_host: str = "127.0.0.1"
+    atlas_port: int = 5055
+    atlas_max_instances: int = 4
+    atlas_sample: int = 0
+    atlas_batch_size: int = 0
+    atlas_cache_max_bytes: int = 10 * 1024 * 1024 * 1024
+    atlas_text_max_chars: int = 4096
+    atlas_embedding_dtype: str = "float32"
+    atlas_umap_projection_mode: str = "full"
+    atlas_umap_anchor_sample: int = 10000
+    atlas_trust_remote_code: bool = False
+    file_serve_roots: str | None = None
+    vis_exclude_dirs: str | None = None
+    vis_exclude_files: str | None = None
+
+    def __post_init__(self) -> None:
+        """Normalize and validate settings the way the env loader expects."""
+        if self.data_file is not None and not self.data_file.strip():
+            object.__setattr__(self, "data_file", None)
+        if self.default_eda_sample != -1 and self.default_eda_sample < 1:
+            raise ValueError("EDA_ROW_LIMIT must be -1 or an integer greater than or equal to 1")
+        object.__setattr__(self, "eda_nested_policy", (self.eda_nested_policy or "stringify").strip().lower())
+        embedding_dtype = (self.atlas_embedding_dtype or "float32").strip().lower()
+        if embedding_dtype not in {"float32", "float16"}:
             raise ValueError("ATLAS_EMBEDDING_DTYPE must be float32 or float16")
-        return normalized
-
-    @field_validator("atlas_sample")
-    @classmethod
-    def validate_atlas_sample(cls, value: int) -> int:
-        """Accept zero for all rows or a positive projection row limit."""
-        if value >= 0:
-            return value
-        raise ValueError("ATLAS_SAMPLE must be greater than or equal to 0")
-
-    @field_validator("atlas_host", mode="before")
-    @classmethod
-    def normalize_atlas_host(cls, value: str | None) -> str:
-        """Restrict child Atlas servers to the supported IPv4 loopback host."""
-        normalized = (value or "127.0.0.1").strip().lower()
-        if normalized in {"localhost", "127.0.0.1"}:
-            return "127.0.0.1"
-        raise ValueError("ATLAS_HOST must be localhost or 127.0.0.1")
-
-    @field_validator("atlas_port")
-    @classmethod
-    def validate_atlas_port(cls, value: int) -> int:
-        """Require a valid TCP port as the Atlas allocation starting point."""
-        if 1 <= value <= 65535:
-            return value
-        raise ValueError("ATLAS_PORT must be between 1 and 65535")
-
-    @field_validator("atlas_max_instances")
-    @classmethod
-    def validate_atlas_max_instances(cls, value: int) -> int:
-        """Require a positive bound for concurrent Atlas child processes."""
-        if value >= 1:
-            return value
-        raise ValueError("ATLAS_MAX_INSTANCES must be greater than or equal to 1")
-
-    @field_validator("atlas_umap_projection_mode", mode="before")
-    @classmethod
-    def normalize_atlas_umap_projection_mode(cls, value: str | None) -> str:
-        """Accept full UMAP or shared-space anchor transform projection."""
-        normalized = (value or "full").strip().lower().replace("-", "_")
-        if normalized not in {"full", "anchor_transform"}:
+        object.__setattr__(self, "atlas_embedding_dtype", embedding_dtype)
+        if self.atlas_sample < 0:
+            raise ValueError("ATLAS_SAMPLE must be greater than or equal to 0")
+        host = (self.atlas_host or "127.0.0.1").strip().lower()
+        if host not in {"localhost", "127.0.0.1"}:
+            raise ValueError("ATLAS_HOST must be localhost or 127.0.0.1")
+        object.__setattr__(self, "atlas_host", "127.0.0.1")
+        if not 1 <= self.atlas_port <= 65535:
+            raise ValueError("ATLAS_PORT must be between 1 and 65535")
+        if self.atlas_max_instances < 1:
+            raise ValueError("ATLAS_MAX_INSTANCES must be greater than or equal to 1")
+        projection_mode = (self.atlas_umap_projection_mode or "full").strip().lower().replace("-", "_")
+        if projection_mode not in {"full", "anchor_transform"}:
             raise ValueError("ATLAS_UMAP_PROJECTION_MODE must be full or anchor_transform")
-        return normalized
-
-    @field_validator("atlas_umap_anchor_sample")
-    @classmethod
-    def validate_atlas_umap_anchor_sample(cls, value: int) -> int:
-        """Require a non-negative UMAP anchor count."""
-        if value >= 0:
-            return value
-        raise ValueError("ATLAS_UMAP_ANCHOR_SAMPLE must be greater than or equal to 0")
-
-    @model_validator(mode="after")
-    def reject_legacy_umap_settings(self) -> Settings:
-        """Reject removed UMAP setting names with explicit migration guidance."""
-        if self.legacy_atlas_projection_mode is not None:
-            raise ValueError("ATLAS_PROJECTION_MODE was removed; use ATLAS_UMAP_PROJECTION_MODE")
-        if self.legacy_atlas_anchor_sample is not None:
-            raise ValueError("ATLAS_ANCHOR_SAMPLE was removed; use ATLAS_UMAP_ANCHOR_SAMPLE")
-        return self
+        object.__setattr__(self, "atlas_umap_projection_mode", projection_mode)
+        if self.atlas_umap_anchor_sample < 0:
+            raise ValueError("ATLAS_UMAP_ANCHOR_SAMPLE must be greater than or equal to 0")
+
+
+_REMOVED_SETTING_NAMES: dict[str, str] = {
+    "ATLAS_PROJECTION_MODE": "ATLAS_UMAP_PROJECTION_MODE",
+    "ATLAS_ANCHOR_SAMPLE": "ATLAS_UMAP_ANCHOR_SAMPLE",
+}
+_TRUE_VALUES = {"1", "true", "yes", "on"}
+_FALSE_VALUES = {"0", "false", "no", "off"}
+
+
+def _env_int(env: Mapping[str, str], name: str, default: int) -> int:
+    raw = env.get(name)
+    if raw is None or not raw.strip():
+        return default
+    try:
+        return int(raw.strip())
+    except ValueError:
+        raise ValueError(f"{name} must be an integer") from None
+
+
+def _env_bool(env: Mapping[str, str], name: str, default: bool) -> bool:
+    raw = env.get(name)
+    if raw is None or not raw.strip():
+        return default
+    lowered = raw.strip().lower()
+    if lowered in _TRUE_VALUES:
+        return True
+    if lowered in _FALSE_VALUES:
+        return False
+    raise ValueError(f"{name} must be a boolean value")
+
+
+def load_settings(env: Mapping[str, str] | None = None) -> Settings:
+    """Build validated :class:`Settings` from one pass over the environment."""
+    if env is None:
+        env = os.environ
+    for old_name, new_name in _REMOVED_SETTING_NAMES.items():
+        if env.get(old_name) is not None:
+            raise ValueError(f"{old_name} was removed; use {new_name}")
+    return Settings(
+        data_file=env.get("DATA_FILE"),
+        data_dir=env.get("DATA_DIR") or str(BASE_DIR / "data"),
+        cache_dir=env.get("CACHE_DIR") or str(BASE_DIR / "cache"),
+        embedder_models_dir=env.get("EMBEDDER_MODELS_DIR") or str(BASE_DIR / "models" / "embedder"),
+        default_eda_sample=_env_int(env, "EDA_ROW_LIMIT", 5000),
+        allow_delete_data=_env_bool(env, "ALLOW_DELETE_DATA", True),
+        eda_cell_max_chars=_env_int(env, "EDA_CELL_MAX_CHARS", 5000),
+        eda_nested_policy=env.get("EDA_NESTED_POLICY") or "stringify",
+        eda_cache_max_bytes=_env_int(env, "EDA_CACHE_MAX_BYTES", 1024 * 1024 * 1024),
+        atlas_host=env.get("ATLAS_HOST") or "127.0.0.1",
+        atlas_port=_env_int(env, "ATLAS_PORT", 5055),
+        atlas_max_instances=_env_int(env, "ATLAS_MAX_INSTANCES", 4),
+        atlas_sample=_env_int(env, "ATLAS_SAMPLE", 0),
+        atlas_batch_size=_env_int(env, "ATLAS_BATCH_SIZE", 0),
+        atlas_cache_max_bytes=_env_int(env, "ATLAS_CACHE_MAX_BYTES", 10 * 1024 * 1024 * 1024),
+        atlas_text_max_chars=_env_int(env, "ATLAS_TEXT_MAX_CHARS", 4096),
+        atlas_embedding_dtype=env.get("ATLAS_EMBEDDING_DTYPE") or "float32",
+        atlas_umap_projection_mode=env.get("ATLAS_UMAP_PROJECTION_MODE") or "full",
+        atlas_umap_anchor_sample=_env_int(env, "ATLAS_UMAP_ANCHOR_SAMPLE", 10000),
+        atlas_trust_remote_code=_env_bool(env, "ATLAS_TRUST_REMOTE_CODE", False),
+        file_serve_roots=env.get("FILE_SERVE_ROOTS"),
+        vis_exclude_dirs=env.get("VIS_EXCLUDE_DIRS"),
+        vis_exclude_files=env.get("VIS_EXCLUDE_FILES"),
+    )
 
 
 # This also covers direct Uvicorn/ASGI startup with LOCAL_DATA_STUDIO_CONFIG_FILE.
 # CLI startup applies the same settings before importing this module.
 RUNTIME_CONFIG, _ = read_runtime_config(None)
 apply_settings_environment(RUNTIME_CONFIG)
-SETTINGS = Settings()
+if ENV_FILE.is_file():
+    # Real environment variables keep precedence over .env entries, matching
+    # the former pydantic-settings env_file behavior.
+    load_dotenv(ENV_FILE, override=False)
+SETTINGS = load_settings()
 
 DATA_FILE_ENV: str | None = SETTINGS.data_file
 DATA_DIR_ENV: str = SETTINGS.data_dir
@@ -5,7 +5,7 @@ from __future__ import annotations
 import base64
 import binascii
 import json
-from collections.abc import Callable
+from collections.abc import Callable, Collection
 from pathlib import Path
 from typing import Any
 
@@ -210,7 +210,7 @@ def raw_row_values(value: Any) -> tuple[list[str], list[Any]]:
     return ["value"], [value]
 
 
-def visible_row_count(total_rows: int, deleted_ids: list[int] | None) -> int:
+def visible_row_count(total_rows: int, deleted_ids: Collection[int] | None) -> int:
     """Subtract valid one-based soft-deleted IDs from a physical row count."""
     deleted = {row_id for row_id in deleted_ids or [] if 1 <= row_id <= total_rows}
     return max(0, total_rows - len(deleted))
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections.abc import Callable, Collection
 from pathlib import Path
 from typing import Any
 
@@ -12,12 +12,14 @@ from ..config import COLUMN_LIMIT_WARNING, DEFAULT_LIMIT
 from ..db import (
     build_table_response,
     describe_relation,
+    fetch_rows,
     fetch_rows_with_rowid,
     normalize_pagination,
     open_connection,
-    quote_ident,
     relation_sql,
     relation_with_rowid_sql,
+    schema_for,
+    search_match_clause,
 )
 from . import json_reader, line, parquet
 from .common import (
@@ -88,15 +90,24 @@ def _duckdb_preview(
     limit: int,
     offset: int,
     page_token: str | None,
-    deleted_ids: list[int],
+    deleted_ids: Collection[int],
 ) -> dict[str, Any]:
     token = decode_page_token_for(page_token, "duckdb")
     if page_token:
         offset = token_int(token, "offset", offset)
-    relation, params = relation_with_rowid_sql(path, deleted_ids)
-    with open_connection() as connection:
-        query = f"SELECT * FROM ({relation}) LIMIT {limit} OFFSET {offset}"
-        columns, rows, row_ids = fetch_rows_with_rowid(connection, query, params)
+    if deleted_ids:
+        relation, params = relation_with_rowid_sql(path, deleted_ids)
+        with open_connection() as connection:
+            query = f"SELECT * FROM ({relation}) LIMIT {limit} OFFSET {offset}"
+            columns, rows, row_ids = fetch_rows_with_rowid(connection, query, params)
+    else:
+        # Without deletions the page is contiguous, so row ids are just the
+        # offset-based ordinals and the __rowid projection can be skipped.
+        relation, params = relation_sql(path)
+        with open_connection() as connection:
+            query = f"SELECT * FROM {relation} LIMIT {limit} OFFSET {offset}"
+            columns, rows = fetch_rows(connection, query, params)
+        row_ids = list(range(offset + 1, offset + 1 + len(rows)))
     next_offset = offset + len(rows)
     has_next = len(rows) == limit
     next_token = encode_page_token({"kind": "duckdb", "offset": next_offset}) if has_next else None
@@ -109,6 +120,27 @@ def _duckdb_preview(
     return response
 
 
+def _keyset_preview(
+    file_name: str,
+    path: Path,
+    limit: int,
+    after_rowid: int,
+    deleted_ids: Collection[int],
+) -> dict[str, Any]:
+    """Page forward from a __rowid cursor without generating and discarding rows.
+
+    ``LIMIT ? OFFSET ?`` forces DuckDB to produce ``offset`` rows per page, so
+    deep pages cost O(offset). Seeking on ``__rowid`` keeps every page O(limit).
+    """
+    relation, params = relation_with_rowid_sql(path, deleted_ids)
+    with open_connection() as connection:
+        query = f"SELECT * FROM ({relation}) WHERE __rowid > {int(after_rowid)} ORDER BY __rowid LIMIT {limit}"
+        columns, rows, row_ids = fetch_rows_with_rowid(connection, query, params)
+    response = build_table_response(file_name, columns, rows, limit, 0, row_ids)
+    response.update({"next_page_token": None, "has_next": len(rows) == limit})
+    return response
+
+
 def fetch_preview_page(
     file_name: str,
     path: Path,
@@ -116,10 +148,15 @@ def fetch_preview_page(
     limit: int | None = DEFAULT_LIMIT,
     offset: int | None = 0,
     page_token: str | None = None,
-    deleted_ids: list[int] | None = None,
+    deleted_ids: Collection[int] | None = None,
+    after_rowid: int | None = None,
 ) -> dict[str, Any]:
     """Fetch one preview page using a format-specific cursor token."""
     limit_value, offset_value = normalize_pagination(limit, offset)
+    # Routes and tests call this directly, so ``after_rowid`` may still be
+    # FastAPI's Query sentinel; anything that is not a real int means unset.
+    if isinstance(after_rowid, int):
+        return _keyset_preview(file_name, path, limit_value, after_rowid, deleted_ids or [])
     reject_large_offset_without_token(offset_value, page_token)
     hidden = set(deleted_ids or [])
     suffix = path.suffix.lower()
@@ -147,7 +184,7 @@ def build_line_index_with_progress(path: Path, control: ScanControl) -> dict[str
     return line.build_line_index_with_progress(path, control)
 
 
-def count_rows_with_progress(path: Path, control: ScanControl, *, deleted_ids: list[int] | None = None) -> int:
+def count_rows_with_progress(path: Path, control: ScanControl, *, deleted_ids: Collection[int] | None = None) -> int:
     """Count rows with format-aware shortcuts and cooperative cancellation."""
     suffix = path.suffix.lower()
     if suffix == ".parquet":
@@ -173,22 +210,21 @@ def _search_duckdb(
     path: Path,
     query: str,
     limit: int,
-    deleted_ids: list[int],
+    deleted_ids: Collection[int],
     control: ScanControl,
 ) -> tuple[list[str], list[list[Any]], list[int], bool, str | None]:
     relation, params = relation_with_rowid_sql(path, deleted_ids)
+    columns_meta = schema_for(path)
+    text_columns = [column["name"] for column in columns_meta if "CHAR" in column["type"].upper() or "TEXT" in column["type"].upper()]
+    if not text_columns:
+        return [column["name"] for column in columns_meta], [], [], False, None
+    match_clause, match_params = search_match_clause(text_columns, query)
+    values = params + match_params
     with open_connection() as connection:
-        base_relation, base_params = relation_sql(path)
-        columns_meta = describe_relation(connection, base_relation, base_params)
-        text_columns = [column["name"] for column in columns_meta if "CHAR" in column["type"].upper() or "TEXT" in column["type"].upper()]
-        if not text_columns:
-            return [column["name"] for column in columns_meta], [], [], False, None
-        clauses = " OR ".join(f"CAST({quote_ident(column)} AS VARCHAR) ILIKE ?" for column in text_columns)
-        values = params + [f"%{query}%"] * len(text_columns)
         control.check_cancelled()
         result_columns, rows, row_ids = fetch_rows_with_rowid(
             connection,
-            f"SELECT * FROM ({relation}) WHERE {clauses} LIMIT {limit}",
+            f"SELECT * FROM ({relation}) WHERE {match_clause} LIMIT {limit}",
             values,
         )
     return result_columns, rows, row_ids, len(rows) == limit, None
@@ -201,7 +237,7 @@ def search_dataset(
     query: str,
     limit: int | None,
     control: ScanControl,
-    deleted_ids: list[int] | None = None,
+    deleted_ids: Collection[int] | None = None,
 ) -> dict[str, Any]:
     """Search a dataset in a background job and return first matching rows."""
     search_term = query.strip()
@@ -1,14 +1,20 @@
 """DuckDB helpers for reading datasets and building responses."""
 
+import functools
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from collections.abc import Collection
 from pathlib import Path
 from typing import Any
 
 import duckdb
 from fastapi import HTTPException
 
-from .config import COLUMN_LIMIT_WARNING, DEFAULT_LIMIT, MAX_COLUMNS, MAX_LIMIT
+from .config import COLUMN_LIMIT_WARNING, DEFAULT_LIMIT, DUCKDB_QUERY_MEMORY_LIMIT, MAX_COLUMNS, MAX_LIMIT
 from .deleted_rows import deleted_row_ids_for
-from .serialization import serialize_rows
+from .serialization import serialize_column, serialize_rows_typed
 
 
 def quote_ident(name: str) -> str:
@@ -21,22 +27,8 @@ def quote_literal(value: str) -> str:
     return "'" + value.replace("'", "''") + "'"
 
 
-def relation_sql(path: Path) -> tuple[str, list[Any]]:
-    """Return a parameterized DuckDB relation for a dataset file."""
-    ext = path.suffix.lower()
-    if ext == ".parquet":
-        return "read_parquet(?)", [str(path)]
-    if ext in {".csv", ".tsv"}:
-        if ext == ".tsv":
-            return "read_csv_auto(?, delim='\t')", [str(path)]
-        return "read_csv_auto(?)", [str(path)]
-    if ext in {".json", ".jsonl"}:
-        return "read_json_auto(?)", [str(path)]
-    raise HTTPException(status_code=400, detail="unsupported file extension")
-
-
-def relation_sql_literal(path: Path) -> str:
-    """Return a literal DuckDB relation string for a dataset file."""
+def dataset_scan_sql(path: Path) -> str:
+    """Return the raw DuckDB scan expression for a dataset file."""
     ext = path.suffix.lower()
     path_literal = quote_literal(str(path))
     if ext == ".parquet":
@@ -50,24 +42,106 @@ def relation_sql_literal(path: Path) -> str:
     raise HTTPException(status_code=400, detail="unsupported file extension")
 
 
-def relation_with_rowid_sql(path: Path, deleted_ids: list[int]) -> tuple[str, list[Any]]:
+def dataset_rowid_scan_sql(path: Path) -> str:
+    """Return a scan that yields dataset columns plus a one-based ``__rowid``.
+
+    Parquet scans expose the file ordinal for free through ``file_row_number``,
+    which streams with the scan. Other formats fall back to an unpartitioned
+    ``row_number()`` window, which materializes its input before emitting rows.
+    """
+    ext = path.suffix.lower()
+    if ext == ".parquet":
+        path_literal = quote_literal(str(path))
+        return f"SELECT file_row_number + 1 AS __rowid, * EXCLUDE (file_row_number) FROM read_parquet({path_literal}, file_row_number=true)"
+    return f"SELECT row_number() OVER () AS __rowid, * FROM {dataset_scan_sql(path)}"
+
+
+_VIEW_CACHE_MAX_ENTRIES = 64
+_VIEW_CACHE_LOCK = threading.Lock()
+_VIEW_CACHE: OrderedDict[tuple[str, int, int, bool], str] = OrderedDict()
+
+
+def ensure_view(path: Path, *, with_rowid: bool = False) -> str:
+    """Register a dataset file as a shared DuckDB view and return its identifier.
+
+    Views are keyed by ``(path, mtime_ns, size)``, so in-place rewrites register a
+    fresh view and never serve stale definitions. The cache is bounded; the least
+    recently used view is dropped on eviction.
+    """
+    scan_sql = f"({dataset_rowid_scan_sql(path)})" if with_rowid else dataset_scan_sql(path)
+    stat = path.stat()
+    key = (str(path), stat.st_mtime_ns, stat.st_size, with_rowid)
+    with _VIEW_CACHE_LOCK:
+        view = _VIEW_CACHE.get(key)
+        if view is not None:
+            _VIEW_CACHE.move_to_end(key)
+            return view
+        view = "f_" + hashlib.sha256(repr(key).encode()).hexdigest()[:16]
+        connection = _shared_connection()
+        connection.execute(f"CREATE OR REPLACE VIEW {view} AS SELECT * FROM {scan_sql}")
+        _VIEW_CACHE[key] = view
+        while len(_VIEW_CACHE) > _VIEW_CACHE_MAX_ENTRIES:
+            _, evicted = _VIEW_CACHE.popitem(last=False)
+            connection.execute(f"DROP VIEW IF EXISTS {evicted}")
+    return view
+
+
+def relation_sql(path: Path) -> tuple[str, list[Any]]:
+    """Return a parameterized DuckDB relation for a dataset file."""
+    return ensure_view(path), []
+
+
+def relation_sql_literal(path: Path) -> str:
+    """Return a literal DuckDB relation string for a dataset file."""
+    return ensure_view(path)
+
+
+_DELETED_TABLE_CACHE_MAX_ENTRIES = 64
+_DELETED_TABLE_LOCK = threading.Lock()
+_DELETED_TABLE_CACHE: OrderedDict[tuple[str, tuple[int, ...]], str] = OrderedDict()
+
+
+def _register_deleted_ids(path: Path, deleted_ids: Collection[int]) -> str:
+    """Materialize session-deleted row ids as a shared table and return its name.
+
+    Inlining hundreds of deleted ids as ``NOT IN (?, ?, …)`` placeholders builds
+    enormous statements and evaluates an O(rows x deletions) predicate. A keyed
+    table lets DuckDB plan a hash anti-join instead. Tables are cached by the
+    exact id set and dropped on LRU eviction.
+    """
+    key = (str(path), tuple(sorted({int(row_id) for row_id in deleted_ids if row_id > 0})))
+    with _DELETED_TABLE_LOCK:
+        table = _DELETED_TABLE_CACHE.get(key)
+        if table is not None:
+            _DELETED_TABLE_CACHE.move_to_end(key)
+            return table
+        table = "del_" + hashlib.sha256(repr(key).encode()).hexdigest()[:16]
+        connection = _shared_connection()
+        connection.execute(
+            f"CREATE OR REPLACE TABLE {table} AS SELECT unnest(?::BIGINT[]) AS __rowid",
+            [list(key[1])],
+        )
+        _DELETED_TABLE_CACHE[key] = table
+        while len(_DELETED_TABLE_CACHE) > _DELETED_TABLE_CACHE_MAX_ENTRIES:
+            _, evicted = _DELETED_TABLE_CACHE.popitem(last=False)
+            connection.execute(f"DROP TABLE IF EXISTS {evicted}")
+    return table
+
+
+def relation_with_rowid_sql(path: Path, deleted_ids: Collection[int]) -> tuple[str, list[Any]]:
     """Return a relation with __rowid applied and session deletes excluded."""
-    rel_sql, params = relation_sql(path)
-    base = f"SELECT *, row_number() OVER () AS __rowid FROM {rel_sql}"
+    view = ensure_view(path, with_rowid=True)
+    base = f"SELECT * FROM {view}"
     if deleted_ids:
-        placeholders = ", ".join(["?"] * len(deleted_ids))
-        base = f"SELECT * FROM ({base}) WHERE __rowid NOT IN ({placeholders})"
-        params = params + deleted_ids
-    return base, params
+        base = f"{base} ANTI JOIN {_register_deleted_ids(path, deleted_ids)} USING (__rowid)"
+    return base, []
 
 
-def relation_with_rowid_literal(path: Path, deleted_ids: list[int]) -> str:
+def relation_with_rowid_literal(path: Path, deleted_ids: Collection[int]) -> str:
     """Return a literal relation with __rowid and exclusions applied."""
-    base = f"SELECT *, row_number() OVER () AS __rowid FROM {relation_sql_literal(path)}"
+    base = f"SELECT * FROM {ensure_view(path, with_rowid=True)}"
     if deleted_ids:
-        id_list = ", ".join(str(int(row_id)) for row_id in deleted_ids if row_id > 0)
-        if id_list:
-            base = f"SELECT * FROM ({base}) WHERE __rowid NOT IN ({id_list})"
+        base = f"{base} ANTI JOIN {_register_deleted_ids(path, deleted_ids)} USING (__rowid)"
     return base
 
 
@@ -78,9 +152,16 @@ def split_row_ids(columns: list[str], rows: list[tuple[Any, ...]]) -> tuple[list
     idx = columns.index("__rowid")
     row_ids: list[int] = []
     cleaned_rows: list[list[Any]] = []
-    for row in rows:
-        row_ids.append(int(row[idx]))
-        cleaned_rows.append(list(row[:idx]) + list(row[idx + 1 :]))
+    if idx == 0:
+        # __rowid is projected first, so removal is one slice per row instead of
+        # two slices plus a concatenation.
+        for row in rows:
+            row_ids.append(int(row[0]))
+            cleaned_rows.append(list(row[1:]))
+    else:
+        for row in rows:
+            row_ids.append(int(row[idx]))
+            cleaned_rows.append(list(row[:idx]) + list(row[idx + 1 :]))
     cleaned_columns = columns[:idx] + columns[idx + 1 :]
     return cleaned_columns, cleaned_rows, row_ids
 
@@ -106,19 +187,35 @@ def build_table_response(
     limit_value: int,
     offset_value: int,
     row_ids: list[int] | None = None,
+    *,
+    columnar: bool = False,
 ) -> dict[str, Any]:
-    """Standard response payload for tabular endpoints."""
+    """Standard response payload for tabular endpoints.
+
+    With ``columnar`` the payload carries one value array per column instead of
+    a list per row, cutting the nested-list allocations and the repeated
+    per-row structure the JSON encoder would otherwise walk.
+    """
     total_columns = len(columns)
     response_columns = columns[:MAX_COLUMNS]
     response_rows = [row[:MAX_COLUMNS] for row in rows]
-    response = {
+    response: dict[str, Any] = {
         "file": file,
         "columns": response_columns,
-        "rows": response_rows,
         "row_ids": row_ids or [],
+        "next_rowid": row_ids[-1] if row_ids else None,
         "limit": limit_value,
         "offset": offset_value,
     }
+    if columnar:
+        if response_rows:
+            response["columns_data"] = {name: list(values) for name, values in zip(response_columns, zip(*response_rows))}
+        else:
+            # An empty page still lists every column so clients can index
+            # columns_data[name] unconditionally.
+            response["columns_data"] = {name: [] for name in response_columns}
+    else:
+        response["rows"] = response_rows
     if total_columns > MAX_COLUMNS:
         response.update(
             {
@@ -130,35 +227,105 @@ def build_table_response(
     return response
 
 
-def open_connection() -> duckdb.DuckDBPyConnection:
-    """Open an in-memory DuckDB connection."""
-    return duckdb.connect(database=":memory:")
+_SHARED_CONNECTION_LOCK = threading.Lock()
+# One-slot holder so the lazy singleton needs no module-global assignment.
+_SHARED_CONNECTION: list[duckdb.DuckDBPyConnection] = []
 
 
-def count_relation_rows(path: Path) -> int:
-    """Count rows for a dataset, respecting session deletions."""
-    deleted_ids = deleted_row_ids_for(path)
-    if deleted_ids:
-        rel_sql, params = relation_with_rowid_sql(path, deleted_ids)
-        query = f"SELECT COUNT(*) FROM ({rel_sql})"
+def _shared_connection() -> duckdb.DuckDBPyConnection:
+    """Create the process-wide in-memory DuckDB connection on first use."""
+    with _SHARED_CONNECTION_LOCK:
+        if not _SHARED_CONNECTION:
+            connection = duckdb.connect(database=":memory:")
+            connection.execute(f"SET threads={os.cpu_count() or 1}")
+            connection.execute(f"SET memory_limit='{DUCKDB_QUERY_MEMORY_LIMIT}'")
+            _SHARED_CONNECTION.append(connection)
+        return _SHARED_CONNECTION[0]
+
+
+def search_match_clause(text_columns: list[str], search_term: str) -> tuple[str, list[Any]]:
+    """Return one ILIKE predicate covering all searchable text columns.
+
+    ORing one ILIKE per column runs the pattern matcher once per column per
+    row. Concatenating the columns with an unprintable separator lets DuckDB
+    scan each row once regardless of width. LIKE wildcards in the user's term
+    are escaped so the search stays a literal substring match.
+    """
+    escaped = search_term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return _match_clause_template(tuple(text_columns)), [f"%{escaped}%"]
+
+
+@functools.lru_cache(maxsize=256)
+def _match_clause_template(text_columns: tuple[str, ...]) -> str:
+    """Build the term-independent predicate SQL once per column set."""
+    if len(text_columns) == 1:
+        return f"CAST({quote_ident(text_columns[0])} AS VARCHAR) ILIKE ? ESCAPE '\\'"
+    concat_expr = "concat_ws(chr(31), " + ", ".join(f"CAST({quote_ident(column)} AS VARCHAR)" for column in text_columns) + ")"
+    return f"{concat_expr} ILIKE ? ESCAPE '\\'"
+
+
+def columnarize_table_response(response: dict[str, Any]) -> dict[str, Any]:
+    """Convert a row-major table response into the columnar layout in place."""
+    rows = response.pop("rows", None)
+    if rows is None:
+        return response
+    if rows:
+        response["columns_data"] = {name: list(values) for name, values in zip(response["columns"], zip(*rows))}
     else:
-        rel_sql, params = relation_sql(path)
-        query = f"SELECT COUNT(*) FROM {rel_sql}"
-    with open_connection() as con:
-        row = con.execute(query, params).fetchone()
-        if row is None:
-            return 0
-        return row[0]
+        # An empty page still lists every column so clients can index
+        # columns_data[name] unconditionally.
+        response["columns_data"] = {name: [] for name in response["columns"]}
+    return response
 
 
-def count_relation_rows_raw(path: Path) -> int:
-    """Count rows for a dataset without session deletions."""
+def open_connection() -> duckdb.DuckDBPyConnection:
+    """Return a request-scoped cursor on the shared in-memory DuckDB connection.
+
+    Connection construction registers extensions and allocates a buffer manager,
+    which is pure overhead when repeated per request. Cursors are cheap, own their
+    session state, and support the same context-manager protocol, so call sites
+    keep using ``with open_connection() as con:`` and close only the cursor.
+    """
+    return _shared_connection().cursor()
+
+
+@functools.lru_cache(maxsize=256)
+def _physical_row_count(path_str: str, mtime_ns: int, size: int) -> int:
+    path = Path(path_str)
+    if path.suffix.lower() == ".parquet":
+        import pyarrow.parquet as pq  # noqa: PLC0415
+
+        return int(pq.ParquetFile(path).metadata.num_rows)
     rel_sql, params = relation_sql(path)
     with open_connection() as con:
         row = con.execute(f"SELECT COUNT(*) FROM {rel_sql}", params).fetchone()
-        if row is None:
-            return 0
-        return row[0]
+    return int(row[0]) if row else 0
+
+
+def count_relation_rows(path: Path) -> int:
+    """Count rows for a dataset, respecting session deletions.
+
+    The physical count is a Parquet footer read or a cached DuckDB scan (see
+    :func:`count_relation_rows_raw`), and session deletions are subtracted
+    arithmetically instead of re-counting through the anti-join relation.
+    """
+    total = count_relation_rows_raw(path)
+    deleted_ids = deleted_row_ids_for(path)
+    if not deleted_ids:
+        return total
+    hidden = sum(1 for row_id in deleted_ids if 1 <= row_id <= total)
+    return max(0, total - hidden)
+
+
+def count_relation_rows_raw(path: Path) -> int:
+    """Count rows for a dataset without session deletions.
+
+    Parquet counts come straight from footer metadata without opening a
+    DuckDB connection. Other formats run ``SELECT COUNT(*)`` once and cache
+    the result keyed by ``(path, mtime_ns, size)`` until the file changes.
+    """
+    stat = path.stat()
+    return _physical_row_count(str(path), stat.st_mtime_ns, stat.st_size)
 
 
 def describe_relation(con: duckdb.DuckDBPyConnection, rel_sql: str, params: list[Any]) -> list[dict[str, str]]:
@@ -167,21 +334,68 @@ def describe_relation(con: duckdb.DuckDBPyConnection, rel_sql: str, params: list
     return [{"name": row[0], "type": row[1]} for row in result]
 
 
+@functools.lru_cache(maxsize=256)
+def _schema_for(path_str: str, mtime_ns: int, size: int) -> tuple[tuple[str, str, str], ...]:
+    rel_sql, params = relation_sql(Path(path_str))
+    with open_connection() as con:
+        result = con.execute(f"DESCRIBE SELECT * FROM {rel_sql}", params).fetchall()
+    return tuple((row[0], row[1], quote_ident(row[0])) for row in result)
+
+
+def schema_for(path: Path) -> list[dict[str, str]]:
+    """Return cached column name/type/quoted metadata for a dataset file.
+
+    The DESCRIBE round-trip is cached by ``(path, mtime_ns, size)``, so
+    repeated schema lookups cost one stat instead of a DuckDB plan+execute.
+    The escaped identifier is precomputed so hot paths skip per-request
+    quoting.
+    """
+    stat = path.stat()
+    return [{"name": name, "type": column_type, "quoted": quoted} for name, column_type, quoted in _schema_for(str(path), stat.st_mtime_ns, stat.st_size)]
+
+
+def _serialize_result_columns(table: Any) -> tuple[list[str], list[list[Any]]]:
+    """Serialize an Arrow result table column-by-column into row lists."""
+    columns = list(table.column_names)
+    serialized = [serialize_column(table.column(index)) for index in range(table.num_columns)]
+    rows = [list(row) for row in zip(*serialized)] if serialized else []
+    return columns, rows
+
+
 def fetch_rows(con: duckdb.DuckDBPyConnection, query: str, params: list[Any]) -> tuple[list[str], list[list[Any]]]:
-    """Execute a query and serialize result rows."""
+    """Execute a query and serialize result rows columnar-first.
+
+    Results come back through Arrow so type dispatch happens once per column
+    instead of once per cell; queries whose types cannot cross the Arrow
+    boundary fall back to row tuples with per-cell serialization.
+    """
     result = con.execute(query, params)
-    description = result.description or []
-    columns = [desc[0] for desc in description]
-    rows = serialize_rows(result.fetchall())
-    return columns, rows
+    try:
+        table = result.to_arrow_table()
+    except duckdb.Error:
+        description = result.description or []
+        columns = [desc[0] for desc in description]
+        column_types = [str(desc[1]) for desc in description]
+        return columns, serialize_rows_typed(result.fetchall(), column_types)
+    return _serialize_result_columns(table)
 
 
 def fetch_rows_with_rowid(con: duckdb.DuckDBPyConnection, query: str, params: list[Any]) -> tuple[list[str], list[list[Any]], list[int]]:
-    """Execute a query, split __rowid, and serialize results."""
+    """Execute a query, split __rowid, and serialize results columnar-first."""
     result = con.execute(query, params)
-    description = result.description or []
-    columns = [desc[0] for desc in description]
-    raw_rows = result.fetchall()
-    columns, rows, row_ids = split_row_ids(columns, raw_rows)
-    rows = serialize_rows(rows)
+    try:
+        table = result.to_arrow_table()
+    except duckdb.Error:
+        description = result.description or []
+        columns = [desc[0] for desc in description]
+        column_types = [str(desc[1]) for desc in description]
+        if "__rowid" in columns:
+            column_types.pop(columns.index("__rowid"))
+        columns, rows, row_ids = split_row_ids(columns, result.fetchall())
+        return columns, serialize_rows_typed(rows, column_types), row_ids
+    row_ids: list[int] = []
+    if "__rowid" in table.column_names:
+        row_ids = [int(row_id) for row_id in table.column("__rowid").to_pylist()]
+        table = table.drop_columns(["__rowid"])
+    columns, rows = _serialize_result_columns(table)
     return columns, rows, row_ids
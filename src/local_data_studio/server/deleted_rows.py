@@ -7,20 +7,30 @@ _DELETED_LOCK = threading.Lock()
 _DELETED_ROWS: dict[str, set[int]] = {}
 
 
-def deleted_row_ids_for(path: Path) -> list[int]:
-    """Return sorted row ids that are hidden in the current session."""
+def deleted_row_ids_for(path: Path) -> frozenset[int]:
+    """Return the row ids that are hidden in the current session.
+
+    The ids come back as an immutable set: membership checks are O(1), the
+    result is hashable for downstream caches, and no per-call sort or copy of
+    the id list is needed. Callers that require an ordering sort explicitly.
+    """
     key = str(path.resolve())
     with _DELETED_LOCK:
-        return sorted(_DELETED_ROWS.get(key, set()))
+        ids = _DELETED_ROWS.get(key)
+        return frozenset(ids) if ids else frozenset()
+
 
+def add_deleted_row_id(path: Path, row_id: int) -> int:
+    """Mark a row id as deleted and return the dataset's deleted-id count.
 
-def add_deleted_row_id(path: Path, row_id: int) -> None:
-    """Mark a row id as deleted for the current session."""
+    Returning the count under the same lock lets callers report it without a
+    second lookup and snapshot copy of the id set.
+    """
     key = str(path.resolve())
     with _DELETED_LOCK:
-        if key not in _DELETED_ROWS:
-            _DELETED_ROWS[key] = set()
-        _DELETED_ROWS[key].add(row_id)
+        ids = _DELETED_ROWS.setdefault(key, set())
+        ids.add(row_id)
+        return len(ids)
 
 
 def clear_deleted_row_ids(path: Path) -> None:
@@ -3,6 +3,10 @@
 from __future__ import annotations
 
 import hashlib
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
@@ -48,7 +52,7 @@ class EdaReportOptions:
 def _query_eda_cache_path(path: Path, sql: str, options: EdaReportOptions) -> Path:
     stat = path.stat()
     payload = f"{path.resolve()}|{stat.st_size}|{stat.st_mtime_ns}|{QUERY_EDA_CACHE_VERSION}|{sql}|{options.sample}|{options.mode}"
-    key = hashlib.sha256(payload.encode("utf-8")).hexdigest()[:12]
+    key = hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()[:12]
     stem = path.stem or "data"
     safe_stem = "".join(ch if ch.isalnum() or ch in ("-", "_") else "_" for ch in stem)
     return EDA_CACHE_DIR / f"{safe_stem}-query-{options.mode}-{key}.html"
@@ -92,14 +96,54 @@ def _drop_query_helper_columns(df: Any) -> Any:
         return drop(drop_columns)
 
 
+_EDA_RENDER_POOL_LOCK = threading.Lock()
+# One-slot holder so the lazy singleton is rebindable without a module-global
+# assignment; ``None`` records that worker processes are unavailable.
+_EDA_RENDER_POOL: list[ProcessPoolExecutor | None] = []
+
+
+def _eda_render_pool() -> ProcessPoolExecutor | None:
+    """Create the shared process pool for CPU-bound profiling renders on first use.
+
+    Returns None when the platform cannot provide worker processes; callers
+    then render on the request thread. Tests stub this to force the
+    in-process path so patched report builders take effect.
+    """
+    with _EDA_RENDER_POOL_LOCK:
+        if not _EDA_RENDER_POOL:
+            try:
+                _EDA_RENDER_POOL.append(ProcessPoolExecutor(max_workers=max(1, (os.cpu_count() or 2) // 2)))
+            except OSError:
+                _EDA_RENDER_POOL.append(None)
+        return _EDA_RENDER_POOL[0]
+
+
+def _render_eda_report(df: Any, title: str, minimal: bool, cache_path: str) -> None:
+    """Build and write one profile report; runs top-level so the pool can pickle it."""
+    report = build_eda_report(df, title=title, minimal=minimal)
+    Path(cache_path).parent.mkdir(parents=True, exist_ok=True)
+    report.to_file(cache_path)
+
+
 def _write_profile_report(df: Any, *, title: str, cache_path: Path, options: EdaReportOptions, context: JobContext | None) -> None:
     try:
         if context is not None:
             context.check_cancelled()
             context.update(progress=0.7, message="Building EDA report")
-        report = build_eda_report(df, title=title, minimal=options.minimal)
-        cache_path.parent.mkdir(parents=True, exist_ok=True)
-        report.to_file(str(cache_path))
+        # Profiling holds the GIL for minutes on large samples; a worker process
+        # keeps the server responsive and lets concurrent reports parallelize.
+        pool = _eda_render_pool()
+        if pool is None:
+            _render_eda_report(df, title, options.minimal, str(cache_path))
+        else:
+            future = pool.submit(_render_eda_report, df, title, options.minimal, str(cache_path))
+            while True:
+                try:
+                    future.result(timeout=0.5)
+                    break
+                except FutureTimeoutError:
+                    if context is not None:
+                        context.check_cancelled()
     except ImportError as exc:
         raise HTTPException(status_code=500, detail="ydata-profiling is not installed") from exc
     except Exception as exc:
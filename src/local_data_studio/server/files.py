@@ -14,6 +14,11 @@ IMAGE_PREVIEW_EXTENSIONS: set[str] = {".png", ".jpg", ".jpeg", ".gif", ".webp",
 _DATASET_CATALOG_LOCK = threading.Lock()
 _DATASET_CATALOG: dict[str, Path] = {}
 _DATASET_CATALOG_READY = threading.Event()
+_DATASET_CATALOG_DIRS: list[Path] = []
+# Mutated in place under the lock so the cache state needs no module-global
+# rebinding: "signature" is the mtime signature of the walked directories and
+# "config" the settings tuple it was computed under.
+_DATASET_CATALOG_STATE: dict[str, tuple | None] = {"signature": None, "config": None}
 
 
 def _resolve_path_best_effort(path: Path) -> Path:
@@ -28,7 +33,16 @@ def _resolve_path_best_effort(path: Path) -> Path:
 
 
 def _is_path_within(path: Path, root: Path) -> bool:
-    return path == root or root in path.parents
+    """Containment check on already-resolved paths via one string prefix test.
+
+    ``root in path.parents`` builds a ``Path`` object per ancestor; the walk
+    runs for every directory and file during discovery, so the prefix form
+    keeps that loop allocation-free.
+    """
+    path_str = os.fspath(path)
+    root_str = os.fspath(root)
+    prefix = root_str if root_str.endswith(os.sep) else root_str + os.sep
+    return path_str == root_str or path_str.startswith(prefix)
 
 
 def _is_excluded_directory(path: Path, excluded_dirs: Sequence[Path]) -> bool:
@@ -48,11 +62,14 @@ def discover_dataset_files(
     single_file: Path | None,
     excluded_dirs: Sequence[Path],
     excluded_files: Sequence[Path] = (),
+    observed_dirs: list[Path] | None = None,
 ) -> list[Path]:
     """Return supported datasets while excluding configured directories and files.
 
     Relative exclusion entries are resolved from ``data_root`` before discovery.
-    ``single_file`` bypasses discovery and is therefore not filtered.
+    ``single_file`` bypasses discovery and is therefore not filtered. When
+    ``observed_dirs`` is given, every walked directory is appended so callers
+    can revalidate the result later from directory mtimes alone.
     """
     if single_file is not None:
         return [single_file] if _is_supported_dataset_file(single_file) else []
@@ -69,6 +86,8 @@ def discover_dataset_files(
         if _is_excluded_directory(current_dir, resolved_excluded_dirs):
             dirnames[:] = []
             continue
+        if observed_dirs is not None:
+            observed_dirs.append(current_dir)
 
         dirnames[:] = [
             dirname
@@ -87,9 +106,43 @@ def discover_dataset_files(
     return sorted(discovered)
 
 
+def _directory_signature(directories: Sequence[Path]) -> tuple[tuple[str, int], ...] | None:
+    """Return the mtime signature of the walked directories, or None when unreadable."""
+    signature: list[tuple[str, int]] = []
+    for directory in directories:
+        try:
+            signature.append((str(directory), directory.stat().st_mtime_ns))
+        except OSError:
+            return None
+    return tuple(signature)
+
+
 def refresh_dataset_file_catalog() -> dict[str, Path]:
-    """Discover datasets and cache an allowlist keyed by their displayed names."""
-    files = discover_dataset_files(DATA_ROOT, SINGLE_FILE, VIS_EXCLUDE_PATHS, VIS_EXCLUDE_FILE_PATHS)
+    """Discover datasets and cache an allowlist keyed by their displayed names.
+
+    Re-walking the whole data tree costs one readdir per directory, so the
+    cached catalog is reused while the mtimes of the previously walked
+    directories are unchanged; any rename, addition, or removal below a walked
+    directory bumps its mtime and triggers a rescan.
+    """
+    config = (
+        str(DATA_ROOT),
+        str(SINGLE_FILE),
+        *(str(path) for path in VIS_EXCLUDE_PATHS),
+        *(str(path) for path in VIS_EXCLUDE_FILE_PATHS),
+    )
+    with _DATASET_CATALOG_LOCK:
+        signature = _DATASET_CATALOG_STATE["signature"]
+        if (
+            _DATASET_CATALOG_READY.is_set()
+            and signature is not None
+            and config == _DATASET_CATALOG_STATE["config"]
+            and _directory_signature(_DATASET_CATALOG_DIRS) == signature
+        ):
+            return dict(_DATASET_CATALOG)
+
+    observed_dirs: list[Path] = []
+    files = discover_dataset_files(DATA_ROOT, SINGLE_FILE, VIS_EXCLUDE_PATHS, VIS_EXCLUDE_FILE_PATHS, observed_dirs)
     catalog: dict[str, Path] = {}
     for path in files:
         resolved = _resolve_path_best_effort(path)
@@ -102,6 +155,9 @@ def refresh_dataset_file_catalog() -> dict[str, Path]:
     with _DATASET_CATALOG_LOCK:
         _DATASET_CATALOG.clear()
         _DATASET_CATALOG.update(catalog)
+        _DATASET_CATALOG_DIRS[:] = observed_dirs or [DATA_ROOT]
+        _DATASET_CATALOG_STATE["signature"] = _directory_signature(_DATASET_CATALOG_DIRS)
+        _DATASET_CATALOG_STATE["config"] = config
         _DATASET_CATALOG_READY.set()
     return dict(catalog)
 
@@ -125,19 +181,25 @@ def resolve_data_file(file_name: str | None) -> Path:
 
 
 def unique_path(directory: Path, filename: str) -> Path:
-    """Return a non-colliding path inside a directory for an upload."""
+    """Return a non-colliding path inside a directory for an upload.
+
+    The directory is listed once instead of probing candidate names with one
+    ``exists`` stat each, so finding a free name stays one readdir even when
+    many numbered copies already exist.
+    """
     base = Path(filename).name
     stem = Path(base).stem or "dataset"
     suffix = Path(base).suffix
-    candidate = directory / base
-    if not candidate.exists():
-        return candidate
+    try:
+        existing = {entry.name for entry in os.scandir(directory)}
+    except OSError:
+        existing = set()
+    if base not in existing:
+        return directory / base
     index = 1
-    while True:
-        candidate = directory / f"{stem}_{index}{suffix}"
-        if not candidate.exists():
-            return candidate
+    while f"{stem}_{index}{suffix}" in existing:
         index += 1
+    return directory / f"{stem}_{index}{suffix}"
 
 
 def _strip_file_url_scheme(path: str) -> str:
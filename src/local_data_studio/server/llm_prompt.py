@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 import json
-import re
 from typing import Any
 
 from fastapi import HTTPException
@@ -67,8 +66,16 @@ def clean_generated_sql(text: str) -> str:
     """
     cleaned = text.strip()
     if cleaned.startswith("```"):
-        cleaned = re.sub(r"^```[a-zA-Z0-9_-]*\s*\n", "", cleaned)
-        cleaned = re.sub(r"\n?```\s*$", "", cleaned).strip()
+        # The fences are fixed prefixes/suffixes, so plain slicing replaces
+        # the regex pair; the opening line is dropped only when it holds
+        # nothing but an optional language tag.
+        line_end = cleaned.find("\n", 3)
+        tag = cleaned[3:line_end].strip() if line_end != -1 else ""
+        if line_end != -1 and (not tag or tag.replace("-", "").replace("_", "").isalnum()):
+            cleaned = cleaned[line_end + 1 :]
+        if cleaned.endswith("```"):
+            cleaned = cleaned[:-3]
+        cleaned = cleaned.strip()
     if cleaned.endswith(";"):
         cleaned = cleaned[:-1].strip()
     if not cleaned:
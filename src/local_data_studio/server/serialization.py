@@ -2,9 +2,13 @@
 
 import datetime
 import decimal
+import functools
 import re
 from itertools import islice
-from typing import Any, Sequence
+from typing import Any, Callable, Sequence
+
+import pyarrow as pa
+import pyarrow.compute as pc
 
 from .config import MAX_CELL_CHARS, MAX_SEQ_ITEMS
 
@@ -43,12 +47,21 @@ def _is_image_bytes_string(value: str) -> bool:
 
 def serialize_value(value: Any, *, key: str | None = None, sibling_image_path: bool = False) -> Any:
     """Convert values into JSON-friendly primitives with size limits."""
-    result: Any = value
+    # Exact-type fast paths for the common cell types skip the isinstance
+    # ladder below; subclasses (numpy scalars, str subtypes) still take it.
+    value_type = type(value)
+    if value is None or value_type is int or value_type is float or value_type is bool:
+        return value
+    if value_type is str:
+        if key == "bytes" and (_is_image_bytes_string(value) or sibling_image_path):
+            return value
+        if len(value) > MAX_CELL_CHARS and not _is_image_reference(value):
+            return value[:MAX_CELL_CHARS] + "... (truncated)"
+        return value
 
-    if value is None:
-        result = None
+    result: Any = value
 
-    elif isinstance(value, (datetime.date, datetime.datetime)):
+    if isinstance(value, (datetime.date, datetime.datetime)):
         result = value.isoformat()
 
     elif isinstance(value, decimal.Decimal):
@@ -113,6 +126,106 @@ def serialize_raw_value(value: Any) -> Any:
     return result
 
 
-def serialize_rows(rows: Sequence[Sequence[Any]]) -> list[list[Any]]:
-    """Serialize a list of row sequences into JSON-friendly lists."""
-    return [[serialize_value(cell) for cell in row] for row in rows]
+_PASSTHROUGH_DUCKDB_TYPES = frozenset(
+    {
+        "BOOLEAN",
+        "TINYINT",
+        "SMALLINT",
+        "INTEGER",
+        "BIGINT",
+        "HUGEINT",
+        "UTINYINT",
+        "USMALLINT",
+        "UINTEGER",
+        "UBIGINT",
+        "FLOAT",
+        "DOUBLE",
+    }
+)
+
+
+def _serialize_text_cell(value: str | None) -> str | None:
+    if value is None or len(value) <= MAX_CELL_CHARS or _is_image_reference(value):
+        return value
+    return value[:MAX_CELL_CHARS] + "... (truncated)"
+
+
+def _serialize_binary_cell(value: bytes | None) -> str | None:
+    if value is None:
+        return None
+    hex_value = value.hex()
+    if len(hex_value) > MAX_CELL_CHARS:
+        return hex_value[:MAX_CELL_CHARS] + "... (truncated)"
+    return hex_value
+
+
+def _serialize_temporal_cell(value: Any) -> str | None:
+    return value.isoformat() if value is not None else None
+
+
+def _serialize_decimal_cell(value: decimal.Decimal | None) -> float | None:
+    return float(value) if value is not None else None
+
+
+@functools.lru_cache(maxsize=64)
+def make_column_serializer(duckdb_type: str) -> Callable[[Any], Any]:
+    """Return a cell serializer specialized to one DuckDB column type.
+
+    DuckDB announces column types up front, so a VARCHAR column never needs
+    the Decimal or bytes branches of :func:`serialize_value`. The specialized
+    functions keep only the branches the type can produce; unknown and nested
+    types fall back to the generic dispatch.
+    """
+    base_type = duckdb_type.split("(", 1)[0].strip().upper()
+    if base_type in _PASSTHROUGH_DUCKDB_TYPES:
+        return lambda value: value
+    if base_type == "VARCHAR":
+        return _serialize_text_cell
+    if base_type == "BLOB":
+        return _serialize_binary_cell
+    if base_type in {"DATE", "TIMESTAMP", "TIMESTAMP WITH TIME ZONE"}:
+        return _serialize_temporal_cell
+    if base_type == "DECIMAL":
+        return _serialize_decimal_cell
+    return serialize_value
+
+
+def serialize_rows_typed(rows: Sequence[Sequence[Any]], column_types: Sequence[str]) -> list[list[Any]]:
+    """Serialize rows with one type dispatch per column using DuckDB types.
+
+    The rows are transposed so each column runs through its specialized
+    serializer in a single C-level ``map``, mirroring what
+    :func:`serialize_column` does for Arrow results on the fallback path
+    where only row tuples and the cursor description are available.
+    """
+    if not rows:
+        return []
+    serializers = [make_column_serializer(column_type) for column_type in column_types]
+    serialized = [list(map(serializer, column)) for serializer, column in zip(serializers, zip(*rows))]
+    return [list(row) for row in zip(*serialized)]
+
+
+def serialize_column(column: Any) -> list[Any]:
+    """Serialize one Arrow column with a single type dispatch per column.
+
+    Per-cell ``serialize_value`` re-checks every cell's type in Python; a
+    columnar result needs that dispatch only once. Numeric, boolean, and short string columns
+    convert straight through Arrow's C ``to_pylist``; temporal and decimal
+    columns use direct converters. Only binary, nested, and other exotic
+    columns fall back to the per-cell ``serialize_value`` logic.
+    """
+    column_type = column.type
+    if pa.types.is_null(column_type) or pa.types.is_integer(column_type) or pa.types.is_floating(column_type) or pa.types.is_boolean(column_type):
+        return column.to_pylist()
+    if pa.types.is_string(column_type) or pa.types.is_large_string(column_type):
+        # pyarrow.compute materializes its kernels at import time, so static
+        # checkers cannot resolve them as module attributes.
+        longest = pc.max(pc.utf8_length(column)).as_py()  # ty: ignore[unresolved-attribute]
+        if longest is None or longest <= MAX_CELL_CHARS:
+            return column.to_pylist()
+        return [serialize_value(value) for value in column.to_pylist()]
+    if pa.types.is_timestamp(column_type) or pa.types.is_date(column_type):
+        return [value.isoformat() if value is not None else None for value in column.to_pylist()]
+    if pa.types.is_decimal(column_type):
+        return [float(value) if value is not None else None for value in column.to_pylist()]
+    return [serialize_value(value) for value in column.to_pylist()]
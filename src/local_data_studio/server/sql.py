@@ -2,13 +2,16 @@
 
 from __future__ import annotations
 
+import functools
 import re
 import time
+from collections.abc import Collection
 from concurrent.futures import Future, ThreadPoolExecutor
 from concurrent.futures import TimeoutError as FutureTimeoutError
 from pathlib import Path
 from typing import Any
 
+import duckdb
 from fastapi import HTTPException
 
 from .config import (
@@ -34,21 +37,31 @@ FULL_SCAN_SQL_PATTERN = re.compile(
 )
 
 
+@functools.lru_cache(maxsize=512)
+def _validate_select_statement(sql: str) -> str:
+    try:
+        statements = duckdb.extract_statements(sql)
+    except duckdb.Error as exc:
+        raise HTTPException(status_code=400, detail="invalid sql") from exc
+    if len(statements) != 1:
+        raise HTTPException(status_code=400, detail="multi-statement sql is not allowed")
+    if statements[0].type != duckdb.StatementType.SELECT:
+        raise HTTPException(status_code=400, detail="only SELECT queries are allowed")
+    return sql.rstrip(";").strip()
+
+
 def normalize_select_sql(sql: str) -> str:
-    """Normalize and validate that SQL is one read-only SELECT/CTE statement."""
+    """Normalize and validate that SQL is one read-only SELECT/CTE statement.
+
+    Validation uses DuckDB's own parser rather than substring checks, so
+    semicolons inside string literals are accepted and statement class is
+    detected authoritatively. Repeated queries hit an LRU cache and skip
+    reparsing.
+    """
     normalized = sql.strip()
     if not normalized:
         raise HTTPException(status_code=400, detail="sql must not be empty")
-
-    if ";" in normalized:
-        normalized = normalized.rstrip(";")
-        if ";" in normalized:
-            raise HTTPException(status_code=400, detail="multi-statement sql is not allowed")
-
-    sql_lower = normalized.lower()
-    if not (sql_lower.startswith("select") or sql_lower.startswith("with")):
-        raise HTTPException(status_code=400, detail="only SELECT queries are allowed")
-    return normalized
+    return _validate_select_statement(normalized)
 
 
 def is_large_dataset(path: Path) -> bool:
@@ -79,7 +92,7 @@ def interrupt_duckdb_connection(connection: Any | None) -> None:
         interrupt()
 
 
-def create_data_view(connection: Any, path: Path, deleted_ids: list[int]) -> None:
+def create_data_view(connection: Any, path: Path, deleted_ids: Collection[int]) -> None:
     """Create the SQL Console's temporary `data` view, respecting soft-deleted rows."""
     if deleted_ids:
         filtered = relation_with_rowid_literal(path, deleted_ids)
@@ -96,7 +109,7 @@ def _execute_query_worker(
     sql: str,
     limit_value: int,
     offset_value: int,
-    deleted_ids: list[int],
+    deleted_ids: Collection[int],
     connection_holder: dict[str, Any],
 ) -> dict[str, Any]:
     with open_connection() as connection:
@@ -113,7 +126,7 @@ def _fetch_raw_query_row_worker(
     path: Path,
     sql: str,
     offset: int,
-    deleted_ids: list[int],
+    deleted_ids: Collection[int],
     connection_holder: dict[str, Any],
 ) -> tuple[list[str], list[Any]]:
     with open_connection() as connection:
@@ -229,7 +242,7 @@ def _load_query_dataframe_worker(
     path: Path,
     sql: str,
     sample: int,
-    deleted_ids: list[int],
+    deleted_ids: Collection[int],
     connection_holder: dict[str, Any],
 ) -> Any:
     with open_connection() as connection:
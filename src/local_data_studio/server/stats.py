@@ -14,6 +14,7 @@ from .column_stats import (
     looks_like_url,
     number_type_label,
     numeric_histogram,
+    numeric_histogram_with_range,
 )
 
 __all__ = [
@@ -30,4 +31,5 @@ __all__ = [
     "looks_like_url",
     "number_type_label",
     "numeric_histogram",
+    "numeric_histogram_with_range",
 ]
@@ -84,6 +84,20 @@ class ApiJobTests(TestCase):
         self.assertEqual(2, len(payload["rows"]))
         self.assertIn("next_page_token", payload)
 
+    def test_preview_columnar_payload_round_trips(self) -> None:
+        """Verify that columnar previews carry the row payload as column arrays."""
+        row_payload = preview(file="example.jsonl", limit=2, offset=0, page_token=None)
+        payload = preview(file="example.jsonl", limit=2, offset=0, page_token=None, columnar=True)
+
+        self.assertNotIn("rows", payload)
+        transposed = [list(values) for values in zip(*row_payload["rows"])]
+        self.assertEqual(dict(zip(payload["columns"], transposed)), payload["columns_data"])
+
+        empty_page = preview(file="example.jsonl", limit=2, offset=10_000, page_token=None, columnar=True)
+
+        self.assertEqual({name: [] for name in empty_page["columns"]}, empty_page["columns_data"])
+        self.assertNotEqual({}, empty_page["columns_data"])
+
     def test_count_job_completes(self) -> None:
         """Verify that count job completes."""
         started = start_count_job(CountJobRequest(file="example.jsonl"))
@@ -173,7 +187,12 @@ class ApiJobTests(TestCase):
             report_columns.extend(df.columns)
             return FakeReport()
 
-        with patch("local_data_studio.server.eda_reports.build_eda_report", side_effect=fake_build_report):
+        with (
+            # Force the in-process render path so the patched builder runs in
+            # this process instead of a pool worker.
+            patch("local_data_studio.server.eda_reports._eda_render_pool", return_value=None),
+            patch("local_data_studio.server.eda_reports.build_eda_report", side_effect=fake_build_report),
+        ):
             started = start_eda_query_job(
                 EdaQueryRequest(
                     file="example.jsonl",
@@ -18,6 +18,7 @@ EXPECTED_API_OPERATIONS = {
     ("/api/column_stats", "get"),
     ("/api/atlas/instances/{instance_id}", "delete"),
     ("/api/config", "get"),
+    ("/api/compact_deleted_rows", "post"),
     ("/api/count", "get"),
     ("/api/delete_column", "post"),
     ("/api/delete_row", "post"),
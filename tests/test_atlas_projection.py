@@ -14,7 +14,7 @@ from local_data_studio.server.atlas_components.contracts import AtlasOptions
 from local_data_studio.server.atlas_components.projection import _embed_in_batches, project_atlas_frame
 from local_data_studio.server.atlas_components.reducers import reduce_embeddings
 from local_data_studio.server.atlas_components.sampling import load_bounded_atlas_frame, sample_atlas_frame
-from local_data_studio.server.config import Settings
+from local_data_studio.server.config import Settings, load_settings
 from local_data_studio.server.jobs import JobCancelledError
 
 
@@ -89,26 +89,26 @@ class AtlasProjectionSettingsTests(TestCase):
 
     def test_negative_sample_is_rejected_by_settings_and_api(self) -> None:
         """Reject invalid limits before loading a dataset or model."""
-        with self.assertRaises(ValidationError):
-            Settings(_env_file=None, ATLAS_SAMPLE=-1)
+        with self.assertRaises(ValueError):
+            Settings(atlas_sample=-1)
         with self.assertRaises(ValidationError):
             AtlasRequest(file="example.jsonl", column="text", model="model", sample=-1)
 
     def test_atlas_runtime_host_port_and_capacity_are_validated(self) -> None:
         """Normalize localhost and reject unsafe process-listener settings."""
-        settings = Settings(_env_file=None, ATLAS_HOST="localhost", ATLAS_PORT=65535, ATLAS_MAX_INSTANCES=4)
+        settings = Settings(atlas_host="localhost", atlas_port=65535, atlas_max_instances=4)
 
         self.assertEqual("127.0.0.1", settings.atlas_host)
         self.assertEqual(65535, settings.atlas_port)
         self.assertEqual(4, settings.atlas_max_instances)
         for invalid_host in ("::1", "0.0.0.0", "example.com"):
-            with self.subTest(host=invalid_host), self.assertRaises(ValidationError):
-                Settings(_env_file=None, ATLAS_HOST=invalid_host)
+            with self.subTest(host=invalid_host), self.assertRaises(ValueError):
+                Settings(atlas_host=invalid_host)
         for invalid_port in (0, 65536):
-            with self.subTest(port=invalid_port), self.assertRaises(ValidationError):
-                Settings(_env_file=None, ATLAS_PORT=invalid_port)
-        with self.assertRaises(ValidationError):
-            Settings(_env_file=None, ATLAS_MAX_INSTANCES=0)
+            with self.subTest(port=invalid_port), self.assertRaises(ValueError):
+                Settings(atlas_port=invalid_port)
+        with self.assertRaises(ValueError):
+            Settings(atlas_max_instances=0)
 
     def test_removed_umap_environment_names_report_replacements(self) -> None:
         """Fail fast when a removed UMAP setting name is still configured."""
@@ -116,8 +116,8 @@ class AtlasProjectionSettingsTests(TestCase):
             ("ATLAS_PROJECTION_MODE", "ATLAS_UMAP_PROJECTION_MODE"),
             ("ATLAS_ANCHOR_SAMPLE", "ATLAS_UMAP_ANCHOR_SAMPLE"),
         ):
-            with self.subTest(old_name=old_name), self.assertRaisesRegex(ValidationError, new_name):
-                Settings(_env_file=None, **{old_name: "1"})
+            with self.subTest(old_name=old_name), self.assertRaisesRegex(ValueError, new_name):
+                load_settings({old_name: "1"})
 
 
 class AtlasReducerTests(TestCase):
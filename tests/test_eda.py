@@ -7,7 +7,6 @@ from unittest.mock import patch
 
 import pandas as pd
 import pytest
-from pydantic import ValidationError
 
 from local_data_studio.server import eda, eda_reports
 from local_data_studio.server.config import Settings
@@ -62,7 +61,7 @@ def test_build_eda_report_uses_ydata_minimal_option() -> None:
 @pytest.mark.parametrize("row_limit", [1, 50_001, -1])
 def test_eda_row_limit_accepts_positive_values_and_unlimited(row_limit: int) -> None:
     """Accept any positive environment limit and the explicit unlimited marker."""
-    settings = Settings(_env_file=None, EDA_ROW_LIMIT=row_limit)
+    settings = Settings(default_eda_sample=row_limit)
 
     assert settings.default_eda_sample == row_limit
     assert EdaReportOptions.from_request(sample=row_limit, mode="minimal", force=False).sample == row_limit
@@ -71,8 +70,8 @@ def test_eda_row_limit_accepts_positive_values_and_unlimited(row_limit: int) ->
 @pytest.mark.parametrize("row_limit", [0, -2])
 def test_eda_row_limit_rejects_other_non_positive_values(row_limit: int) -> None:
     """Reject ambiguous or unsupported non-positive EDA row limits."""
-    with pytest.raises(ValidationError, match="EDA_ROW_LIMIT must be -1"):
-        Settings(_env_file=None, EDA_ROW_LIMIT=row_limit)
+    with pytest.raises(ValueError, match="EDA_ROW_LIMIT must be -1"):
+        Settings(default_eda_sample=row_limit)
 
 
 def test_unlimited_eda_loads_the_complete_dataset(tmp_path: Path) -> None:
@@ -150,6 +149,9 @@ def test_eda_reports_use_dedicated_cache_and_prune_oldest(tmp_path: Path) -> Non
         patch.object(eda_reports, "EDA_CACHE_DIR", cache_dir),
         patch.object(eda_reports, "EDA_CACHE_MAX_BYTES", 15),
         patch.object(eda_reports, "load_eda_dataframe", return_value=pd.DataFrame({"value": [1]})),
+        # Render in-process so the patched builder applies even when earlier
+        # tests already forked real pool workers.
+        patch.object(eda_reports, "_eda_render_pool", return_value=None),
         patch.object(eda_reports, "build_eda_report", return_value=FakeReport()),
     ):
         first = generate_dataset_eda_report(
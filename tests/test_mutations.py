@@ -0,0 +1,126 @@
+"""Tests for dataset mutation endpoint behavior."""
+
+import json
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+from unittest.mock import patch
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from local_data_studio.server.api.mutations import compact_deleted_rows
+from local_data_studio.server.api.schemas import CompactDeletedRowsRequest
+from local_data_studio.server.delete_ops import delete_column_jsonl, delete_row_jsonl
+from local_data_studio.server.deleted_rows import add_deleted_row_id, deleted_row_ids_for
+
+
+def _compact(path: Path) -> dict:
+    """Invoke the endpoint against one resolved dataset path."""
+    with patch("local_data_studio.server.api.mutations.resolve_data_file", return_value=path):
+        return compact_deleted_rows(CompactDeletedRowsRequest(file=path.name))
+
+
+class JsonlRowDeleteTests(TestCase):
+    """Test JSONL row-delete rewrite behavior."""
+
+    def test_whitespace_only_lines_do_not_shift_row_ids(self) -> None:
+        """Skip whitespace-only lines so row IDs stay aligned with previews."""
+        with TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "data.jsonl"
+            path.write_text('{"id": 1}\n \t\n{"id": 2}\n', encoding="utf-8")
+
+            delete_row_jsonl(path, 2)
+
+            self.assertEqual([{"id": 1}], [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()])
+
+    def test_row_delete_keeps_untouched_row_bytes_exact(self) -> None:
+        """Copy kept rows byte-for-byte so wide integers survive the rewrite."""
+        wide = '{"id": 123456789012345678901234567890}\n'
+        with TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "data.jsonl"
+            path.write_text('{"id": 1}\n' + wide, encoding="utf-8")
+
+            delete_row_jsonl(path, 1)
+
+            self.assertEqual(wide, path.read_text(encoding="utf-8"))
+
+    def test_column_delete_keeps_rows_without_the_column_exact(self) -> None:
+        """Copy rows where the name only appears inside a value byte-for-byte."""
+        untouched = '{"note": "\\"id\\"", "serial": 123456789012345678901234567890}\n'
+        with TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "data.jsonl"
+            path.write_text('{"id": 1, "name": "Ada"}\n' + untouched, encoding="utf-8")
+
+            delete_column_jsonl(path, "id")
+
+            lines = path.read_text(encoding="utf-8").splitlines(keepends=True)
+            self.assertEqual({"name": "Ada"}, json.loads(lines[0]))
+            self.assertEqual(untouched, lines[1])
+
+
+class CompactDeletedRowsTests(TestCase):
+    """Test compaction endpoint behavior."""
+
+    def test_compaction_rewrites_each_format_and_clears_tombstones(self) -> None:
+        """Apply every session delete in one rewrite and drop the tombstones."""
+        with TemporaryDirectory() as tmpdir:
+            with self.subTest("jsonl"):
+                path = Path(tmpdir) / "data.jsonl"
+                path.write_text('{"id": 1}\n{"id": 2}\n{"id": 3}\n', encoding="utf-8")
+                add_deleted_row_id(path, 1)
+                add_deleted_row_id(path, 3)
+
+                payload = _compact(path)
+
+                self.assertEqual({"file": "data.jsonl", "persisted": True, "compacted_rows": 2}, payload)
+                self.assertEqual([{"id": 2}], [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()])
+                self.assertEqual(frozenset(), deleted_row_ids_for(path))
+
+            with self.subTest("csv"):
+                path = Path(tmpdir) / "data.csv"
+                path.write_text("id,name\n1,Ada\n2,Linus\n3,Grace\n", encoding="utf-8")
+                add_deleted_row_id(path, 2)
+
+                payload = _compact(path)
+
+                remaining = path.read_text(encoding="utf-8")
+                self.assertEqual(1, payload["compacted_rows"])
+                self.assertIn("Ada", remaining)
+                self.assertIn("Grace", remaining)
+                self.assertNotIn("Linus", remaining)
+                self.assertEqual(frozenset(), deleted_row_ids_for(path))
+
+            with self.subTest("json"):
+                path = Path(tmpdir) / "data.json"
+                path.write_text(json.dumps([{"id": 1}, {"id": 2}, {"id": 3}]), encoding="utf-8")
+                add_deleted_row_id(path, 1)
+
+                payload = _compact(path)
+
+                self.assertEqual(1, payload["compacted_rows"])
+                self.assertEqual([{"id": 2}, {"id": 3}], json.loads(path.read_text(encoding="utf-8")))
+                self.assertEqual(frozenset(), deleted_row_ids_for(path))
+
+            with self.subTest("parquet"):
+                path = Path(tmpdir) / "data.parquet"
+                pq.write_table(pa.Table.from_pylist([{"id": 1}, {"id": 2}, {"id": 3}]), path)
+                add_deleted_row_id(path, 3)
+
+                payload = _compact(path)
+
+                self.assertEqual(1, payload["compacted_rows"])
+                self.assertEqual([1, 2], pq.read_table(path).column("id").to_pylist())
+                self.assertEqual(frozenset(), deleted_row_ids_for(path))
+
+    def test_compaction_without_tombstones_leaves_the_file_alone(self) -> None:
+        """Report zero compacted rows and skip the rewrite entirely."""
+        with TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "data.jsonl"
+            content = '{"id": 1}\n{"id": 2}\n'
+            path.write_text(content, encoding="utf-8")
+
+            payload = _compact(path)
+
+            self.assertEqual(0, payload["compacted_rows"])
+            self.assertEqual(content, path.read_text(encoding="utf-8"))
@@ -306,6 +306,22 @@ class ReaderPreviewTests(TestCase):
             self.assertEqual([[3]], page["rows"])
             self.assertEqual([3], page["row_ids"])
 
+    def test_preview_resumes_after_rowid_cursor(self) -> None:
+        """Verify that preview pages forward from a __rowid cursor."""
+        with TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "data.jsonl"
+            path.write_text('{"id": 1}\n{"id": 2}\n{"id": 3}\n', encoding="utf-8")
+
+            page = fetch_preview_page("data.jsonl", path, limit=2, after_rowid=1)
+            last = fetch_preview_page("data.jsonl", path, limit=2, after_rowid=page["next_rowid"])
+
+            self.assertEqual([[2], [3]], page["rows"])
+            self.assertEqual([2, 3], page["row_ids"])
+            self.assertEqual(3, page["next_rowid"])
+            self.assertTrue(page["has_next"])
+            self.assertEqual([], last["rows"])
+            self.assertFalse(last["has_next"])
+
     def test_jsonl_preview_limits_dynamic_columns(self) -> None:
         """Verify that jsonl preview limits dynamic columns."""
         with TemporaryDirectory() as tmpdir:
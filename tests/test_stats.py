@@ -3,11 +3,14 @@
 from __future__ import annotations
 
 import json
+from collections.abc import Iterator
 from pathlib import Path
 from tempfile import TemporaryDirectory
 from unittest import TestCase
 from unittest.mock import patch
 
+import pyarrow as pa
+
 from local_data_studio.server.stats import (
     compute_column_stats,
     discrete_counts,
@@ -124,16 +127,20 @@ class ColumnStatisticsContractTests(TestCase):
     def test_statistics_fetch_rows_in_bounded_batches(self) -> None:
         """Verify that statistics avoid materializing DuckDB's complete row matrix."""
 
+        class _FakeBatch:
+            def __init__(self, values: list[int]) -> None:
+                self.num_rows = len(values)
+                self.columns = [pa.array(values)]
+
         class _FakeResult:
             description = [("value",)]
 
             def __init__(self) -> None:
-                self.fetch_sizes: list[int] = []
-                self.batches = [[(1,)], [(2,)], []]
+                self.batch_sizes: list[int] = []
 
-            def fetchmany(self, size: int) -> list[tuple[int]]:
-                self.fetch_sizes.append(size)
-                return self.batches.pop(0)
+            def to_arrow_reader(self, size: int) -> Iterator[_FakeBatch]:
+                self.batch_sizes.append(size)
+                return iter([_FakeBatch([1]), _FakeBatch([2])])
 
         class _FakeConnection:
             def __init__(self, result: _FakeResult) -> None:
@@ -162,6 +169,6 @@ class ColumnStatisticsContractTests(TestCase):
         ):
             result = compute_column_stats("sample.jsonl", Path("sample.jsonl"), sample=50)
 
-        self.assertEqual([1_024, 1_024, 1_024], cursor.fetch_sizes)
+        self.assertEqual([1_024], cursor.batch_sizes)
         self.assertEqual(2, result["sample"])
         self.assertEqual([1, 1], result["columns"][0]["bins"])